@@ -2,17 +2,21 @@
 # FULL BATTERY SUPPORT ADDED: 402/404/405/406 + 422/424/425/426 + 442/444/445/446
 
 import sys
+import re
 import cantools
 import can
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import QTimer, Qt
 import threading
 import time
+import struct
+from collections import deque
+from functools import lru_cache, partial
 
 # RetainVar integration - using original code exactly
 try:
     from can_communication import (
-        RetainVarMonitor, CANResult, BaudRate,
+        RetainVarMonitor, CANCommunication, CANResult, BaudRate,
         CANError, MessageType, CANMessage
     )
     RETAINVAR_AVAILABLE = True
@@ -36,6 +40,13 @@ BUSTYPE2 = 'pcan'
 
 def list_pcan_channels():
     """List available PCAN channels"""
+    if RETAINVAR_AVAILABLE:
+        # Open BUS1 through BUS9 concurrently; each driver init blocks, so
+        # this waits for the slowest channel instead of all nine in turn
+        candidates = [f'PCAN_USBBUS{i}' for i in range(1, 10)]
+        results = CANCommunication.probe_channels(candidates, BaudRate.BAUD_250K)
+        return [channel for channel in candidates if results[channel] == CANResult.ERR_OK]
+
     import can
     try:
         # Try to detect available PCAN channels
@@ -52,6 +63,16 @@ def list_pcan_channels():
     except:
         return []
 
+NON_HEX_RE = re.compile(r'[^0-9A-Fa-f]')
+
+@lru_cache(maxsize=256)
+def parse_raw_payload(text):
+    """Parse the 8-byte hex payload typed into a send field, or None if invalid"""
+    clean = NON_HEX_RE.sub('', text)
+    if len(clean) != 16:
+        return None
+    return bytes.fromhex(clean)
+
 # === CAN IDs ===
 ID_727 = 0x727
 ID_587 = 0x587
@@ -84,6 +105,35 @@ ID_GPS_SPEED_FRAME = 0x09F8020A
 BAT1_FRAMES = [0x400, 0x401, 0x402, 0x403, 0x404, 0x405, 0x406]
 BAT2_FRAMES = [0x420, 0x421, 0x422, 0x423, 0x424, 0x425, 0x426]
 BAT3_FRAMES = [0x440, 0x441, 0x442, 0x443, 0x444, 0x445, 0x446]
+# Battery frame ID -> battery number, for one hashed lookup instead of scanning the lists
+BATTERY_OF_FRAME = {fid: idx for idx, frames in ((1, BAT1_FRAMES), (2, BAT2_FRAMES), (3, BAT3_FRAMES))
+                    for fid in frames}
+
+# Battery frame field layouts
+BAT_CELL_AVG = struct.Struct('>2xH4x')  # 404: V_Cell_Avg, big-endian bytes 2-3
+BAT_COUNTERS = struct.Struct('<II')  # 405: Nb_Cycles, Ah_Discharged (0.1 Ah), little-endian
+BAT_ALARMS_1_8 = ("Alarm_1","Alarm_2","Alarm_3","Alarm_4","Alarm_5","Alarm_6","Alarm_7","Alarm_8")
+BAT_ALARMS_9_16 = ("Alarm_9","Alarm_10","Alarm_11","Alarm_12","Alarm_13","Alarm_14","Alarm_15","Alarm_16")
+# Alarm signal entry for every byte value, and the whole frame's signals when no alarm is set
+BAT_ALARM_VALUES = tuple({"d": str(value), "v": value, "u": ""} for value in range(256))
+BAT_ALARMS_CLEAR = {names: {name: BAT_ALARM_VALUES[0] for name in names}
+                    for names in (BAT_ALARMS_1_8, BAT_ALARMS_9_16)}
+BAT_NO_ALARMS = bytes(8)
+
+# 404 byte 4: aux contacts in the low nibble, contactor states in the high nibble.
+# The decoded signals for every possible byte value are built once, so the
+# decoder does one table lookup instead of eight bit tests per frame
+BAT_CONTACTOR_BITS = (
+    ("Contactor_4_Aux", 0x01), ("Contactor_3_Aux", 0x02),
+    ("Contactor_2_Aux", 0x04), ("Contactor_1_Aux", 0x08),
+    ("Contactor_4_State", 0x10), ("Contactor_3_State_Precharge", 0x20),
+    ("Contactor_2_State_Neg", 0x40), ("Contactor_1_State_Pos", 0x80),
+)
+BAT_CONTACTOR_SIGNALS = tuple(
+    {name: {"d": "Closed" if byte & mask else "Open", "v": bool(byte & mask), "u": ""}
+     for name, mask in BAT_CONTACTOR_BITS}
+    for byte in range(256)
+)
 
 # PCU FRAMES (Power Control Unit)
 PCU_FRAMES = [0x720, 0x722, 0x724]
@@ -130,6 +180,39 @@ def get_emulator_interval(can_id):
     return EMULATOR_INTERVALS.get(can_id, EMULATOR_INTERVAL_DEFAULT)
 
 
+# Pause before a notifier receives again after a bus error, so a persistent
+# fault (e.g. PCAN bus-off) cannot spin its thread (seconds)
+RX_ERROR_BACKOFF = 0.1
+
+
+class RxListener(can.Listener):
+    """Queues received frames for the GUI timer and counts bus errors"""
+
+    def __init__(self, monitor, can_bus):
+        self.monitor = monitor
+        self.can_bus = can_bus
+        self.rx_frames = monitor._rx_frames
+
+    def on_message_received(self, msg):
+        # The notifier thread only appends to the queue (deque appends are
+        # atomic), so receiving never waits on the monitor's lock
+        rx_frames = self.rx_frames
+        if len(rx_frames) == rx_frames.maxlen:
+            # The append below discards the oldest frame
+            monitor = self.monitor
+            with monitor._rx_drop_lock:
+                monitor.rx_dropped += 1
+        rx_frames.append((msg, self.can_bus))
+
+    def on_error(self, exc):
+        # Handling the error keeps the notifier receiving; without this
+        # python-can ends its thread on the first exception from bus.recv
+        monitor = self.monitor
+        with monitor.lock:
+            monitor.error_count += 1
+        time.sleep(RX_ERROR_BACKOFF)
+
+
 class CANMonitor(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -137,13 +220,18 @@ class CANMonitor(QMainWindow):
         self.resize(3000, 1600)
         self.bus1 = None
         self.bus2 = None
+        self.notifier1 = None
+        self.notifier2 = None
         self.bus1_connected = False
         self.bus2_connected = False
         self.active_can = 1  # 1 or 2
         self.tables = {}
         self.battery_tabs = {}
         self.lock = threading.Lock()
-        self.raw_log_lines = []
+        self.raw_log_lines = deque(maxlen=200)  # Oldest lines drop off as new ones arrive
+        self._rx_frames = deque(maxlen=10000)  # (message, CAN bus) received since the last GUI tick
+        self._rx_drop_lock = threading.Lock()  # Guards rx_dropped, shared by both notifier threads
+        self.rx_dropped = 0  # Frames lost because _rx_frames was full
         self.error_count = 0
         self.first_fill = {}
         self.bat1_cycle_index = 0
@@ -154,6 +242,48 @@ class CANMonitor(QMainWindow):
         except Exception as e:
             print("DBC load failed:", e)
             self.db = cantools.database.Database()
+        self._dbc_decoders = {}  # DBC frame ID -> (decode function, signal unit map)
+        self._last_payload = {}  # Frame ID -> payload its current signals were decoded from
+        self._dirty_fids = set()  # Frame IDs whose signals changed since the last update_gui
+        self._painted_modified = {}  # Table key -> user-modified values it was last painted with
+        self._raw_log_shown = []  # Raw log lines currently in the raw log view
+        self._table_items = {}  # Signal table -> its cell items, by row and column
+        self._tx_messages = {}  # CAN ID -> can.Message reused by send_raw
+
+        # Battery frame ID -> decoder; every battery repeats the layout at its own 0x20-aligned base ID
+        battery_layout = {
+            0x02: partial(self.decode_battery_alarms, BAT_ALARMS_1_8),
+            0x04: self.decode_battery_status,
+            0x05: self.decode_battery_counters,
+            0x06: partial(self.decode_battery_alarms, BAT_ALARMS_9_16),
+        }
+        self._battery_decoders = {
+            fid: battery_layout[fid & 0x1F]
+            for fid in BATTERY_OF_FRAME
+            if fid & 0x1F in battery_layout
+        }
+
+        # Frame ID -> decoder taking the payload; frames not listed fall back to the DBC
+        self._frame_decoders = dict(self._battery_decoders)
+        self._frame_decoders.update({fid: partial(self.decode_pcu_frame, fid) for fid in PCU_FRAMES})
+        self._frame_decoders.update({
+            ID_HV_CHARGER_STATUS: self.decode_hv_charger_status,
+            ID_HV_CHARGER_CMD: self.decode_hv_charger_cmd,
+            ID_DC12_COMM: self.decode_dc12_comm,
+            ID_DC12_STAT: self.decode_dc12_stat,
+            ID_CCU_STATUS: self.decode_ccu_stat,
+            ID_ZCU_PUMP: self.decode_zcu_stat,
+            ID_TEMP_FRAME: self.decode_temperature_frame,
+            ID_VOLT_FRAME: self.decode_voltage_frame,
+            ID_CURRENT_FRAME: self.decode_current_frame,
+            ID_DRIVE_FRAME: self.decode_drive_frame,
+            ID_SPDTQ_FRAME: self.decode_spdtq_frame,
+            ID_TCU_ENABLE_FRAME: self.decode_tcu_enable_frame,
+            ID_TCU_PRND_FRAME: self.decode_tcu_prnd_frame,
+            ID_TCU_THROTTLE_FRAME: self.decode_tcu_throttle_frame,
+            ID_TCU_TRIM_FRAME: self.decode_tcu_trim_frame,
+            ID_GPS_SPEED_FRAME: self.decode_gps_speed_frame,
+        })
 
         all_ids = [ID_727,ID_587,ID_107,ID_607,ID_CMD_BMS,ID_PDU_STATUS,ID_HMI_STATUS,
                    ID_PCU_COOL,ID_PCU_MOTOR,ID_PCU_POWER,ID_CCU_STATUS,ID_ZCU_PUMP,
@@ -326,53 +456,46 @@ class CANMonitor(QMainWindow):
 
     # === NEW: Full manual decoding of battery frames (402,404,405,406) ===
     def decode_battery_frame(self, frame_id: int, data: bytes):
-        if len(data) < 8:
-            return {}
-        b = data
-        signals = {}
+        decoder = self._battery_decoders.get(frame_id)
+        return decoder(data) if decoder is not None else {}
 
-        if frame_id in (0x402, 0x422, 0x442):  # Alarms 1-8
-            alarms = ["Alarm_1","Alarm_2","Alarm_3","Alarm_4","Alarm_5","Alarm_6","Alarm_7","Alarm_8"]
-            for i, name in enumerate(alarms):
-                signals[name] = {"d": f"{b[i]}", "v": b[i], "u": ""}
-
-        elif frame_id in (0x404, 0x424, 0x444):
-            # Byte 0
-            signals["Isol_Board_Powered"] = {"d": "Yes" if b[0] & 0x01 else "No", "v": bool(b[0] & 0x01), "u": ""}
-            # Byte 1
-            signals["Open_Sw_Error"] = {"d": "Yes" if b[1] & 0x01 else "No", "v": bool(b[1] & 0x01), "u": ""}
-            signals["No_Closing_Sw_Error"] = {"d": "Yes" if (b[1] & 0x02) else "No", "v": bool(b[1] & 0x02), "u": ""}
-            # Byte 2-3: V_Cell_Avg
-            v_avg = (b[2] << 8) | b[3]
-            signals["V_Cell_Avg"] = {"d": f"{v_avg}", "v": v_avg, "u": "mV"}
-            # Byte 4: Contactor states
-            aux = b[4] & 0x0F
-            main = (b[4] >> 4) & 0x0F
-            signals["Contactor_4_Aux"] = {"d": "Closed" if aux & 0x01 else "Open", "v": bool(aux & 0x01), "u": ""}
-            signals["Contactor_3_Aux"] = {"d": "Closed" if aux & 0x02 else "Open", "v": bool(aux & 0x02), "u": ""}
-            signals["Contactor_2_Aux"] = {"d": "Closed" if aux & 0x04 else "Open", "v": bool(aux & 0x04), "u": ""}
-            signals["Contactor_1_Aux"] = {"d": "Closed" if aux & 0x08 else "Open", "v": bool(aux & 0x08), "u": ""}
-            signals["Contactor_4_State"] = {"d": "Closed" if main & 0x01 else "Open", "v": bool(main & 0x01), "u": ""}
-            signals["Contactor_3_State_Precharge"] = {"d": "Closed" if main & 0x02 else "Open", "v": bool(main & 0x02), "u": ""}
-            signals["Contactor_2_State_Neg"] = {"d": "Closed" if main & 0x04 else "Open", "v": bool(main & 0x04), "u": ""}
-            signals["Contactor_1_State_Pos"] = {"d": "Closed" if main & 0x08 else "Open", "v": bool(main & 0x08), "u": ""}
-            # Byte 5
-            signals["Is_Balancing_Active"] = {"d": "Yes" if b[5] & 0x01 else "No", "v": bool(b[5] & 0x01), "u": ""}
-
-        elif frame_id in (0x405, 0x425, 0x445):
-            nb_cycles = (b[3] << 24) | (b[2] << 16) | (b[1] << 8) | b[0]
-            ah_discharged = (b[7] << 24) | (b[6] << 16) | (b[5] << 8) | b[4]
-            signals["Nb_Cycles"] = {"d": str(nb_cycles), "v": nb_cycles, "u": ""}
-            signals["Ah_Discharged"] = {"d": f"{ah_discharged / 10.0:.1f}", "v": ah_discharged / 10.0, "u": "Ah"}
-            signals["Remaining_Time_Before_Opening"] = {"d": str(b[7]), "v": b[7], "u": "s"}
-
-        elif frame_id in (0x406, 0x426, 0x446):  # Alarms 9-16
-            alarms = ["Alarm_9","Alarm_10","Alarm_11","Alarm_12","Alarm_13","Alarm_14","Alarm_15","Alarm_16"]
-            for i, name in enumerate(alarms):
-                signals[name] = {"d": f"{b[i]}", "v": b[i], "u": ""}
+    def decode_battery_alarms(self, names, data):
+        # 402/422/442 (Alarms 1-8) and 406/426/446 (Alarms 9-16): one byte per alarm
+        if len(data) < 8: return {}
+        # No alarm set is the usual case and costs a single bytes compare
+        if data[:8] == BAT_NO_ALARMS:
+            return BAT_ALARMS_CLEAR[names]
+        return {name: BAT_ALARM_VALUES[value] for name, value in zip(names, data)}
 
+    def decode_battery_status(self, data):
+        # 404/424/444
+        if len(data) < 8: return {}
+        b = data
+        signals = {}
+        # Byte 0
+        signals["Isol_Board_Powered"] = {"d": "Yes" if b[0] & 0x01 else "No", "v": bool(b[0] & 0x01), "u": ""}
+        # Byte 1
+        signals["Open_Sw_Error"] = {"d": "Yes" if b[1] & 0x01 else "No", "v": bool(b[1] & 0x01), "u": ""}
+        signals["No_Closing_Sw_Error"] = {"d": "Yes" if (b[1] & 0x02) else "No", "v": bool(b[1] & 0x02), "u": ""}
+        # Byte 2-3: V_Cell_Avg
+        v_avg, = BAT_CELL_AVG.unpack_from(b)
+        signals["V_Cell_Avg"] = {"d": f"{v_avg}", "v": v_avg, "u": "mV"}
+        # Byte 4: Contactor states
+        signals.update(BAT_CONTACTOR_SIGNALS[b[4]])
+        # Byte 5
+        signals["Is_Balancing_Active"] = {"d": "Yes" if b[5] & 0x01 else "No", "v": bool(b[5] & 0x01), "u": ""}
         return signals
 
+    def decode_battery_counters(self, data):
+        # 405/425/445
+        if len(data) < 8: return {}
+        nb_cycles, ah_discharged = BAT_COUNTERS.unpack_from(data)
+        return {
+            "Nb_Cycles": {"d": str(nb_cycles), "v": nb_cycles, "u": ""},
+            "Ah_Discharged": {"d": f"{ah_discharged / 10.0:.1f}", "v": ah_discharged / 10.0, "u": "Ah"},
+            "Remaining_Time_Before_Opening": {"d": str(data[7]), "v": data[7], "u": "s"},
+        }
+
     def decode_hv_charger_cmd(self, data):
         if len(data) < 8: return {}
         b = data
@@ -542,13 +665,13 @@ class CANMonitor(QMainWindow):
         hv_batt_raw = (b[1] << 8) | b[0]
         hv_mot_raw = (b[3] << 8) | b[2]
         # Convert to signed 16-bit
-        hv_batt = ((hv_batt_raw + 0x8000) % 0x10000 - 0x8000) * 0.1
-        hv_mot = ((hv_mot_raw + 0x8000) % 0x10000 - 0x8000) * 0.1
+        hv_batt = ((hv_batt_raw ^ 0x8000) - 0x8000) * 0.1
+        hv_mot = ((hv_mot_raw ^ 0x8000) - 0x8000) * 0.1
         # 8-bit signed values
-        dcdc = ((b[4] + 128) % 256 - 128)
-        aux1 = ((b[5] + 128) % 256 - 128)
-        aux2 = ((b[6] + 128) % 256 - 128)
-        lvbat = ((b[7] + 128) % 256 - 128)
+        dcdc = ((b[4] ^ 0x80) - 0x80)
+        aux1 = ((b[5] ^ 0x80) - 0x80)
+        aux2 = ((b[6] ^ 0x80) - 0x80)
+        lvbat = ((b[7] ^ 0x80) - 0x80)
         return {
             "HV_BATT_Current": {"d": f"{hv_batt:+.1f}", "u": "A"},
             "HV_MOT_Current": {"d": f"{hv_mot:+.1f}", "u": "A"},
@@ -650,11 +773,11 @@ class CANMonitor(QMainWindow):
 
         # Motor Speed: 16-bit little-endian signed, 1 rpm per bit
         motor_speed_raw = (b[1] << 8) | b[0]
-        motor_speed = ((motor_speed_raw + 0x8000) % 0x10000 - 0x8000)  # Signed 16-bit
+        motor_speed = ((motor_speed_raw ^ 0x8000) - 0x8000)  # Signed 16-bit
 
         # Motor Torque: 16-bit little-endian signed, 0.1 Nm per bit
         motor_torque_raw = (b[3] << 8) | b[2]
-        motor_torque = ((motor_torque_raw + 0x8000) % 0x10000 - 0x8000) * 0.1  # Signed 16-bit
+        motor_torque = ((motor_torque_raw ^ 0x8000) - 0x8000) * 0.1  # Signed 16-bit
 
         # Motor hours: 16-bit little-endian unsigned, 1 hour per bit
         motor_hours = (b[5] << 8) | b[4]
@@ -732,7 +855,7 @@ class CANMonitor(QMainWindow):
 
         # Inverter current: 16-bit little-endian signed, 1 bit per 0.1A
         inv_current_raw = (b[7] << 8) | b[6]
-        inv_current = ((inv_current_raw + 0x8000) % 0x10000 - 0x8000) * 0.1
+        inv_current = ((inv_current_raw ^ 0x8000) - 0x8000) * 0.1
 
         return {
             "AUXILIARY_POWER": {"d": auxiliary_power, "u": "", "v": bool(mode & 0x01)},
@@ -763,7 +886,7 @@ class CANMonitor(QMainWindow):
 
             # Motor Torque: 16-bit little-endian signed, 1 bit per 0.1Nm, range -30000 to 30000
             torque_raw = (b[3] << 8) | b[2]
-            torque = ((torque_raw + 0x8000) % 0x10000 - 0x8000) * 0.1
+            torque = ((torque_raw ^ 0x8000) - 0x8000) * 0.1
             signals["MOTOR_TORQUE"] = {"d": f"{torque:+.1f}", "u": "Nm", "v": torque}
 
             # Motor Speed: 16-bit little-endian unsigned, 1 bit per rpm, range 0-30000
@@ -1325,15 +1448,21 @@ class CANMonitor(QMainWindow):
         if not buses_to_send:
             return
 
-        clean = ''.join(c for c in text.upper() if c in '0123456789ABCDEF ')
-        clean = clean.replace(" ", "")
-        if len(clean) != 16: return
-
+        # Periodic senders pass the same field text every tick, so the
+        # parsed payload is cached per text
+        payload = parse_raw_payload(text)
+        if payload is None: return
+
+        # Each emulated ID reuses one frame for every tick and every bus; only
+        # the payload changes. Payloads are always 8 bytes, so the DLC is fixed
+        msg = self._tx_messages.get(can_id)
+        if msg is None:
+            msg = self._tx_messages[can_id] = can.Message(
+                arbitration_id=can_id, data=payload, is_extended_id=(can_id > 0x7FF))
+        else:
+            msg.data = payload
         for bus, bus_num in buses_to_send:
             try:
-                data = bytes.fromhex(clean)
-                is_extended = (can_id > 0x7FF)
-                msg = can.Message(arbitration_id=can_id, data=data, is_extended_id=is_extended)
                 bus.send(msg)
                 self.process_message_for_gui(msg, bus_num)
             except Exception as e:
@@ -1343,127 +1472,153 @@ class CANMonitor(QMainWindow):
     # === Message Processing ===
     def process_message_for_gui(self, msg, can_bus=1):
         with self.lock:
-            self.raw_log_lines.append(f"CAN{can_bus} | 0x{msg.arbitration_id:08X} | {msg.data.hex(' ').upper()}")
-            if len(self.raw_log_lines) > 200:
-                self.raw_log_lines.pop(0)
-
-            # Update current hex data for this ID
-            hex_data = msg.data.hex(' ').upper()
-            self.current_hex[msg.arbitration_id] = hex_data
-
-            # Update hex display label if it exists
-            if msg.arbitration_id in self.hex_labels:
-                if msg.arbitration_id > 0x7FF:  # Extended ID
-                    self.hex_labels[msg.arbitration_id].setText(f"0x{msg.arbitration_id:08X}: {hex_data}")
-                else:  # Standard ID
-                    self.hex_labels[msg.arbitration_id].setText(f"0x{msg.arbitration_id:03X}: {hex_data}")
-
-        fid = msg.arbitration_id
-
-        if fid == ID_HV_CHARGER_STATUS:
-            decoded_signals = self.decode_hv_charger_status(msg.data)
-        elif fid == ID_HV_CHARGER_CMD:
-            decoded_signals = self.decode_hv_charger_cmd(msg.data)
-        elif fid == ID_DC12_COMM:
-            decoded_signals = self.decode_dc12_comm(msg.data)
-        elif fid == ID_DC12_STAT:
-            decoded_signals = self.decode_dc12_stat(msg.data)
-        elif fid == ID_CCU_STATUS:
-            decoded_signals = self.decode_ccu_stat(msg.data)
-        elif fid == ID_ZCU_PUMP:
-            decoded_signals = self.decode_zcu_stat(msg.data)
-        elif fid == ID_TEMP_FRAME:
-            decoded_signals = self.decode_temperature_frame(msg.data)
-        elif fid == ID_VOLT_FRAME:
-            decoded_signals = self.decode_voltage_frame(msg.data)
-        elif fid == ID_CURRENT_FRAME:
-            decoded_signals = self.decode_current_frame(msg.data)
-        elif fid == ID_DRIVE_FRAME:
-            decoded_signals = self.decode_drive_frame(msg.data)
-        elif fid == ID_SPDTQ_FRAME:
-            decoded_signals = self.decode_spdtq_frame(msg.data)
-        elif fid == ID_TCU_ENABLE_FRAME:
-            decoded_signals = self.decode_tcu_enable_frame(msg.data)
-        elif fid == ID_TCU_PRND_FRAME:
-            decoded_signals = self.decode_tcu_prnd_frame(msg.data)
-        elif fid == ID_TCU_THROTTLE_FRAME:
-            decoded_signals = self.decode_tcu_throttle_frame(msg.data)
-        elif fid == ID_TCU_TRIM_FRAME:
-            decoded_signals = self.decode_tcu_trim_frame(msg.data)
-        elif fid == ID_GPS_SPEED_FRAME:
-            decoded_signals = self.decode_gps_speed_frame(msg.data)
-        elif fid in PCU_FRAMES:
-            decoded_signals = self.decode_pcu_frame(fid, msg.data)
-        elif fid in [0x402,0x422,0x442,0x404,0x424,0x444,0x405,0x425,0x445,0x406,0x426,0x446]:
-            decoded_signals = self.decode_battery_frame(fid, msg.data)
+            hex_data = self._log_frame(msg, can_bus)
+            self._decode_frame(msg.arbitration_id, msg.data, hex_data)
+
+    def _log_frame(self, msg, can_bus):
+        """Append one frame to the raw log and return its payload as hex; the caller holds self.lock"""
+        hex_data = msg.data.hex(' ').upper()
+        self.raw_log_lines.append(f"CAN{can_bus} | 0x{msg.arbitration_id:08X} | {hex_data}")
+        return hex_data
+
+    def _decode_frame(self, fid, data, hex_data):
+        """Show a frame's payload and decode it into self.signals; the caller holds self.lock"""
+        # Update current hex data for this ID
+        self.current_hex[fid] = hex_data
+
+        # Update hex display label if it exists
+        if fid in self.hex_labels:
+            if fid > 0x7FF:  # Extended ID
+                self.hex_labels[fid].setText(f"0x{fid:08X}: {hex_data}")
+            else:  # Standard ID
+                self.hex_labels[fid].setText(f"0x{fid:03X}: {hex_data}")
+
+        data = bytes(data)
+
+        # Periodic frames mostly repeat their last payload; the decoded values and
+        # their display strings are then unchanged, so only the timestamps move
+        self._dirty_fids.add(fid)
+        signals = self.signals.get(fid)
+        if signals and self._last_payload.get(fid) == data:
+            now = time.time()
+            for sig in signals.values():
+                sig["t"] = now
+            return
+
+        decoder = self._frame_decoders.get(fid)
+        if decoder is not None:
+            decoded_signals = decoder(data)
         else:
             dbc_id = self.HEX_TO_DBC_ID.get(fid)
             if dbc_id is not None:
                 try:
-                    decoded = self.db.decode_message(dbc_id, msg.data)
-                    unit_map = {s.name: s.unit or "" for s in self.db.get_message_by_frame_id(dbc_id).signals}
-                    with self.lock:
-                        self.signals[fid].update({
-                            name: {"v": value,
-                                   "d": f"{value:.3f}" if isinstance(value,float) else str(value),
-                                   "u": unit_map.get(name,""),
-                                   "t": time.time()}
-                            for name, value in decoded.items()
-                        })
+                    # Look the DBC message up once per frame ID and reuse its
+                    # bound decoder and unit map for every later frame
+                    decoder = self._dbc_decoders.get(dbc_id)
+                    if decoder is None:
+                        dbc_msg = self.db.get_message_by_frame_id(dbc_id)
+                        decoder = self._dbc_decoders[dbc_id] = (
+                            dbc_msg.decode, {s.name: s.unit or "" for s in dbc_msg.signals})
+                    decode, unit_map = decoder
+                    decoded = decode(data)
+                    now = time.time()
+                    self.signals[fid].update({
+                        name: {"v": value,
+                               "d": f"{value:.3f}" if isinstance(value,float) else str(value),
+                               "u": unit_map.get(name,""),
+                               "t": now}
+                        for name, value in decoded.items()
+                    })
+                    self._last_payload[fid] = data
                     return
                 except:
                     return
             else:
                 return
 
-        if 'decoded_signals' in locals():
-            with self.lock:
-                self.signals[fid].update({
-                    name: {
-                        "d": val["d"], 
-                        "u": val["u"], 
-                        "v": val.get("v", val["d"]),  # Store value if available, otherwise use display
-                        "t": time.time()
-                    }
-                    for name, val in decoded_signals.items()
-                })
-
-    def can_listener1(self):
-        while self.bus1_connected:
-            try:
-                msg = self.bus1.recv(timeout=0.1)
-                if msg:
-                    if getattr(msg, 'is_error_frame', False):
-                        with self.lock:
-                            self.error_count += 1
-                    else:
-                        self.process_message_for_gui(msg, can_bus=1)
-            except:
-                pass
-
-    def can_listener2(self):
-        while self.bus2_connected:
-            try:
-                msg = self.bus2.recv(timeout=0.1)
-                if msg:
-                    if getattr(msg, 'is_error_frame', False):
-                        with self.lock:
-                            self.error_count += 1
-                    else:
-                        # Suppress CAN2 receive debug prints
-                        self.process_message_for_gui(msg, can_bus=2)
-            except Exception as e:
-                # Suppress CAN2 listener errors
-                pass
+        now = time.time()
+        self.signals[fid].update({
+            name: {
+                "d": val["d"],
+                "u": val["u"],
+                "v": val.get("v", val["d"]),  # Store value if available, otherwise use display
+                "t": now
+            }
+            for name, val in decoded_signals.items()
+        })
+        self._last_payload[fid] = data
+
+    def start_listener(self, bus, can_bus):
+        """Receive from bus on a python-can Notifier that queues frames for the GUI timer"""
+        # Decoding happens in update_gui on the GUI thread
+        return can.Notifier(bus, [RxListener(self, can_bus)], timeout=0.1)
+
+    def drain_rx_frames(self):
+        """Decode the frames the notifiers queued since the last GUI tick"""
+        rx_frames = self._rx_frames
+        if not rx_frames:
+            return
+        log_frame = self._log_frame
+        latest = {}  # Frame ID -> (payload, hex or None) of its newest frame in this batch
+        count = len(rx_frames)
+        # The raw log keeps only its last maxlen lines, so earlier frames of a
+        # large batch are never formatted
+        log_from = count - self.raw_log_lines.maxlen
+        # One lock acquisition covers the whole batch instead of two per frame
+        with self.lock:
+            # Only the newest payload of each ID is ever displayed, so
+            # decoding is once per ID per tick however busy the bus is
+            for i in range(count):
+                msg, can_bus = rx_frames.popleft()
+                if msg.is_error_frame:
+                    self.error_count += 1
+                elif i >= log_from:
+                    latest[msg.arbitration_id] = (msg.data, log_frame(msg, can_bus))
+                else:
+                    latest[msg.arbitration_id] = (msg.data, None)
+            for fid, (data, hex_data) in latest.items():
+                if hex_data is None:
+                    hex_data = data.hex(' ').upper()
+                try:
+                    self._decode_frame(fid, data, hex_data)
+                except:
+                    pass
+
+    def _table_stale(self, key, fids, dirty):
+        """Return True if the table showing fids has changed since it was last painted"""
+        # Live signals only change when their frame is decoded; user edits are
+        # caught by comparing the modified values against the last paint
+        modified = tuple(tuple(self.modified_signals.get(fid, {}).items()) for fid in fids)
+        if not dirty.isdisjoint(fids) or modified != self._painted_modified.get(key):
+            self._painted_modified[key] = modified
+            return True
+        return False
+
+    def _table_cells(self, table, rows):
+        """Size a signal table to rows and return its items, cached as one 4-item list per row"""
+        # Items are created once per row and then only updated with setText,
+        # so painting never has to look them up through table.item()
+        cells = self._table_items.setdefault(table, [])
+        if table.rowCount() != rows:
+            table.setRowCount(rows)
+        # setRowCount deletes the items of removed rows, so forget those too
+        del cells[rows:]
+        cells.extend([None] * 4 for _ in range(rows - len(cells)))
+        return cells
 
     def update_gui(self):
+        self.drain_rx_frames()
+
         with self.lock:
-            lines = self.raw_log_lines[-8:]
+            lines = list(self.raw_log_lines)[-8:]
+            dirty, self._dirty_fids = self._dirty_fids, set()
 
         # Regular tables
         for fid, table in self.tables.items():
+            if not self._table_stale(fid, (fid,), dirty):
+                continue
             items = list(self.signals.get(fid, {}).items())
-            table.setRowCount(len(items))
+            cells = self._table_cells(table, len(items))
             for r, (name, d) in enumerate(items):
                 # For editable frames, use modified value if available, otherwise use live CAN data
                 editable_frames = [0x580, 0x600, 0x72E, ID_HV_CHARGER_STATUS, ID_DC12_STAT]
@@ -1480,10 +1635,11 @@ class CANMonitor(QMainWindow):
                     is_modified = False
 
                 for c, val in enumerate([name, display_val, d.get("u",""), f"{d.get('t',0):.3f}"]):
-                    item = table.item(r, c)
+                    item = cells[r][c]
                     if not item:
                         item = QTableWidgetItem(val)
                         table.setItem(r, c, item)
+                        cells[r][c] = item
                         # Make the value column (column 1) editable for editable frames
                         if c == 1 and fid in editable_frames:
                             item.setFlags(item.flags() | Qt.ItemIsEditable)
@@ -1512,6 +1668,8 @@ class CANMonitor(QMainWindow):
 
         # Battery tabs (merged view)
         for idx, frames in [(1,BAT1_FRAMES),(2,BAT2_FRAMES),(3,BAT3_FRAMES)]:
+            if not self._table_stale(f"BT{idx}", frames, dirty):
+                continue
             table = self.battery_tabs[idx]
             all_sig = []
             for fid in frames:
@@ -1589,16 +1747,17 @@ class CANMonitor(QMainWindow):
                     all_sig.append((name, display_data, fid))  # Include frame ID
 
             all_sig.sort(key=lambda x: x[0])  # Sort by signal name
-            table.setRowCount(len(all_sig))
+            cells = self._table_cells(table, len(all_sig))
             for r, (name, d, fid) in enumerate(all_sig):
                 # Check if this value is modified
                 is_modified = self.modified_signals.get(fid, {}).get(name) is not None
 
                 for c, val in enumerate([name, d.get("d",""), d.get("u",""), f"{d.get('t',0):.3f}"]):
-                    item = table.item(r, c)
+                    item = cells[r][c]
                     if not item:
                         item = QTableWidgetItem(val)
                         table.setItem(r, c, item)
+                        cells[r][c] = item
                         # Make the value column (column 1) editable for Battery 1 (like PCU stat)
                         if idx == 1 and c == 1:
                             item.setFlags(item.flags() | Qt.ItemIsEditable)
@@ -1632,7 +1791,7 @@ class CANMonitor(QMainWindow):
                 table._item_changed_connected = True
 
         # PCU tab (merged view)
-        if hasattr(self, 'pcu_tab'):
+        if hasattr(self, 'pcu_tab') and self._table_stale("PCU", PCU_FRAMES, dirty):
             table = self.pcu_tab
             all_sig = []
             for fid in PCU_FRAMES:
@@ -1646,16 +1805,17 @@ class CANMonitor(QMainWindow):
                     all_sig.append((name, display_data, fid))  # Include frame ID
 
             all_sig.sort(key=lambda x: x[0])  # Sort by signal name
-            table.setRowCount(len(all_sig))
+            cells = self._table_cells(table, len(all_sig))
             for r, (name, d, fid) in enumerate(all_sig):
                 # Check if this value is modified
                 is_modified = self.modified_signals.get(fid, {}).get(name) is not None
 
                 for c, val in enumerate([name, d.get("d",""), d.get("u",""), f"{d.get('t',0):.3f}"]):
-                    item = table.item(r, c)
+                    item = cells[r][c]
                     if not item:
                         item = QTableWidgetItem(val)
                         table.setItem(r, c, item)
+                        cells[r][c] = item
                         # Make the value column (column 1) editable for PCU frames
                         if c == 1:
                             item.setFlags(item.flags() | Qt.ItemIsEditable)
@@ -1684,9 +1844,9 @@ class CANMonitor(QMainWindow):
                 table._item_changed_connected = True
 
         # TCU tab (dedicated TCU parameters table)
-        if hasattr(self, 'tcu_tab'):
+        tcu_frames = [ID_TCU_ENABLE_FRAME, ID_TCU_PRND_FRAME, ID_TCU_THROTTLE_FRAME, ID_TCU_TRIM_FRAME, ID_GPS_SPEED_FRAME]
+        if hasattr(self, 'tcu_tab') and self._table_stale("TCU", tcu_frames, dirty):
             table = self.tcu_tab
-            tcu_frames = [ID_TCU_ENABLE_FRAME, ID_TCU_PRND_FRAME, ID_TCU_THROTTLE_FRAME, ID_TCU_TRIM_FRAME, ID_GPS_SPEED_FRAME]
             all_sig = []
             for fid in tcu_frames:
                 # Add default signals for TCU frames if they don't exist
@@ -1723,16 +1883,17 @@ class CANMonitor(QMainWindow):
                     all_sig.append((name, display_data, fid))  # Include frame ID
 
             all_sig.sort(key=lambda x: x[0])  # Sort by signal name
-            table.setRowCount(len(all_sig))
+            cells = self._table_cells(table, len(all_sig))
             for r, (name, d, fid) in enumerate(all_sig):
                 # Check if this value is modified
                 is_modified = self.modified_signals.get(fid, {}).get(name) is not None
 
                 for c, val in enumerate([name, d.get("d",""), d.get("u",""), f"{d.get('t',0):.3f}"]):
-                    item = table.item(r, c)
+                    item = cells[r][c]
                     if not item:
                         item = QTableWidgetItem(val)
                         table.setItem(r, c, item)
+                        cells[r][c] = item
                         # Make the value column (column 1) editable for TCU frames
                         if c == 1:
                             item.setFlags(item.flags() | Qt.ItemIsEditable)
@@ -1764,74 +1925,80 @@ class CANMonitor(QMainWindow):
         hmi_frames = [ID_TEMP_FRAME, ID_VOLT_FRAME, ID_CURRENT_FRAME, ID_DRIVE_FRAME, ID_SPDTQ_FRAME]
         tcu_frames = [ID_TCU_ENABLE_FRAME, ID_TCU_PRND_FRAME, ID_TCU_THROTTLE_FRAME, ID_TCU_TRIM_FRAME, ID_GPS_SPEED_FRAME]
         editable_hmi_frames = [ID_DRIVE_FRAME]  # Only Drive frame is editable in main HMI table (TCU frames have their own table)
-        table = self.hmi_tab
-        # Collect signals with their frame IDs
-        all_sig_with_fid = []
-        for fid in hmi_frames:
-            for name, d in self.signals.get(fid, {}).items():
-                all_sig_with_fid.append((name, d, fid))
-        all_sig_with_fid.sort(key=lambda x: x[0])  # Sort by signal name
+        if self._table_stale("HMI", hmi_frames, dirty):
+            table = self.hmi_tab
+            # Collect signals with their frame IDs
+            all_sig_with_fid = []
+            for fid in hmi_frames:
+                for name, d in self.signals.get(fid, {}).items():
+                    all_sig_with_fid.append((name, d, fid))
+            all_sig_with_fid.sort(key=lambda x: x[0])  # Sort by signal name
         
-        table.setRowCount(len(all_sig_with_fid))
-        for r, (name, d, fid) in enumerate(all_sig_with_fid):
-            # For editable frames (TCU frames and Drive frame), use modified value if available, otherwise use live CAN data
-            is_editable_frame = fid in editable_hmi_frames
-            if is_editable_frame:
-                modified_data = self.modified_signals.get(fid, {}).get(name)
-                if modified_data:
-                    display_val = modified_data.get("d", d.get("d",""))
-                    is_modified = True
+            cells = self._table_cells(table, len(all_sig_with_fid))
+            for r, (name, d, fid) in enumerate(all_sig_with_fid):
+                # For editable frames (TCU frames and Drive frame), use modified value if available, otherwise use live CAN data
+                is_editable_frame = fid in editable_hmi_frames
+                if is_editable_frame:
+                    modified_data = self.modified_signals.get(fid, {}).get(name)
+                    if modified_data:
+                        display_val = modified_data.get("d", d.get("d",""))
+                        is_modified = True
+                    else:
+                        display_val = d.get("d","")
+                        is_modified = False
                 else:
                     display_val = d.get("d","")
                     is_modified = False
-            else:
-                display_val = d.get("d","")
-                is_modified = False
             
-            for c, val in enumerate([name, display_val, d.get("u",""), f"{d.get('t',0):.3f}"]):
-                item = table.item(r, c)
-                if not item:
-                    item = QTableWidgetItem(val)
-                    table.setItem(r, c, item)
-                else:
-                    # Only update if not currently being edited by user
-                    if not table.isPersistentEditorOpen(item):
-                        item.setText(val)
+                for c, val in enumerate([name, display_val, d.get("u",""), f"{d.get('t',0):.3f}"]):
+                    item = cells[r][c]
+                    if not item:
+                        item = QTableWidgetItem(val)
+                        table.setItem(r, c, item)
+                        cells[r][c] = item
+                    else:
+                        # Only update if not currently being edited by user
+                        if not table.isPersistentEditorOpen(item):
+                            item.setText(val)
                 
-                # Store frame_id in item data for editable frames (always set, even if item exists)
-                if is_editable_frame and c == 1:
-                    item.setData(Qt.UserRole, fid)
-                    # Make the value column (column 1) editable for editable frames
-                    item.setFlags(item.flags() | Qt.ItemIsEditable)
-                    # Update background color
-                    if is_modified:
+                    # Store frame_id in item data for editable frames (always set, even if item exists)
+                    if is_editable_frame and c == 1:
+                        item.setData(Qt.UserRole, fid)
+                        # Make the value column (column 1) editable for editable frames
+                        item.setFlags(item.flags() | Qt.ItemIsEditable)
+                        # Update background color
+                        if is_modified:
+                            item.setBackground(Qt.yellow)
+                        else:
+                            item.setBackground(Qt.white)
+                    elif c == 1 and is_modified:
+                        # Highlight modified values for non-TCU frames too
                         item.setBackground(Qt.yellow)
-                    else:
-                        item.setBackground(Qt.white)
-                elif c == 1 and is_modified:
-                    # Highlight modified values for non-TCU frames too
-                    item.setBackground(Qt.yellow)
-        if self.first_fill.get("HMI", False):
-            table.resizeColumnsToContents()
-            self.first_fill["HMI"] = False
+            if self.first_fill.get("HMI", False):
+                table.resizeColumnsToContents()
+                self.first_fill["HMI"] = False
         
-        # Connect item changed signal for HMI table (TCU frames)
-        if not hasattr(table, '_hmi_item_changed_connected'):
-            table.itemChanged.connect(self.on_hmi_table_item_changed)
-            table._hmi_item_changed_connected = True
+            # Connect item changed signal for HMI table (TCU frames)
+            if not hasattr(table, '_hmi_item_changed_connected'):
+                table.itemChanged.connect(self.on_hmi_table_item_changed)
+                table._hmi_item_changed_connected = True
 
-        self.raw_log.clear()
-        for l in lines:
-            self.raw_log.append(l)
+        # Rewrite the raw log view only when its last lines changed
+        if lines != self._raw_log_shown:
+            self._raw_log_shown = lines
+            self.raw_log.setPlainText("\n".join(lines))
+
+        # Frames lost to a full receive queue are shown after either status
+        dropped = f" | DROPPED: {self.rx_dropped}" if self.rx_dropped else ""
 
         # Update CAN1 status
         can1_status = "CONNECTED" if self.bus1_connected and self.error_count == 0 else f"NOISE: {self.error_count}"
-        self.status_label1.setText(f"CAN1: {can1_status}")
+        self.status_label1.setText(f"CAN1: {can1_status}{dropped}")
         self.status_label1.setStyleSheet("color:green;" if self.bus1_connected and self.error_count == 0 else "color:orange;" if self.bus1_connected else "color:#d32f2f;")
 
         # Update CAN2 status
         can2_status = "CONNECTED" if self.bus2_connected and self.error_count == 0 else f"NOISE: {self.error_count}"
-        self.status_label2.setText(f"CAN2: {can2_status}")
+        self.status_label2.setText(f"CAN2: {can2_status}{dropped}")
         self.status_label2.setStyleSheet("color:green;" if self.bus2_connected and self.error_count == 0 else "color:orange;" if self.bus2_connected else "color:#d32f2f;")
 
     def on_table_item_changed(self, item, frame_id):
@@ -2075,7 +2242,7 @@ class CANMonitor(QMainWindow):
 
     def update_battery_hex_from_table(self, frame_id):
         """Update hex payload for Battery 1 frames when table values change"""
-        if frame_id not in BAT1_FRAMES:
+        if BATTERY_OF_FRAME.get(frame_id) != 1:
             return
 
         try:
@@ -2132,7 +2299,7 @@ class CANMonitor(QMainWindow):
             return
 
         try:
-            b = [0] * 8
+            b = bytearray(8)
 
             # Collect all signal values (use modified if available, otherwise use live)
             signal_values = {}
@@ -2192,7 +2359,7 @@ class CANMonitor(QMainWindow):
                 b[7] = max(0, min(255, int(error_codes)))
 
             # Convert to hex string
-            hex_string = ' '.join(f"{x:02X}" for x in b)
+            hex_string = b.hex(' ').upper()
 
             # Update the hex input field
             input_attr = f"input_{frame_id:x}"
@@ -2216,7 +2383,7 @@ class CANMonitor(QMainWindow):
             return
 
         try:
-            b = [0] * 8
+            b = bytearray(8)
 
             # Collect all signal values (use modified if available, otherwise use live)
             signal_values = {}
@@ -2268,7 +2435,7 @@ class CANMonitor(QMainWindow):
                 b[6] = max(0, min(255, int(status)))
 
             # Convert to hex string
-            hex_string = ' '.join(f"{x:02X}" for x in b)
+            hex_string = b.hex(' ').upper()
 
             # Update the hex input field
             input_attr = f"input_{frame_id:x}"
@@ -2290,7 +2457,7 @@ class CANMonitor(QMainWindow):
             return
 
         try:
-            b = [0] * 8
+            b = bytearray(8)
 
             # Collect all signal values (use modified if available, otherwise use live)
             signal_values = {}
@@ -2340,7 +2507,7 @@ class CANMonitor(QMainWindow):
                 b[5] = max(0, min(255, int(temp + 40)))
 
             # Convert to hex string
-            hex_string = ' '.join(f"{x:02X}" for x in b)
+            hex_string = b.hex(' ').upper()
 
             # Update the hex input field
             input_attr = f"input_{frame_id:x}"
@@ -2362,7 +2529,7 @@ class CANMonitor(QMainWindow):
             return
 
         try:
-            b = [0] * 8
+            b = bytearray(8)
 
             # Collect all signal values (use modified if available, otherwise use live)
             signal_values = {}
@@ -2405,7 +2572,7 @@ class CANMonitor(QMainWindow):
                 b[7] = max(0, min(255, int(temp + 40)))
 
             # Convert to hex string
-            hex_string = ' '.join(f"{x:02X}" for x in b)
+            hex_string = b.hex(' ').upper()
 
             # Update the hex input field
             input_attr = f"input_{frame_id:x}"
@@ -2428,7 +2595,7 @@ class CANMonitor(QMainWindow):
             return
 
         try:
-            b = [0] * 8
+            b = bytearray(8)
 
             # Collect all signal values (use modified if available, otherwise use live)
             signal_values = {}
@@ -2524,7 +2691,7 @@ class CANMonitor(QMainWindow):
                         b[i] = default[i]
 
             # Convert to hex string
-            hex_string = ' '.join(f"{x:02X}" for x in b)
+            hex_string = b.hex(' ').upper()
 
             # Update the hex input field in TCU emulator
             if hasattr(self, 'tcu_inputs') and frame_id in self.tcu_inputs:
@@ -2545,7 +2712,7 @@ class CANMonitor(QMainWindow):
             return
 
         try:
-            b = [0] * 8
+            b = bytearray(8)
 
             # Collect all signal values (use modified if available, otherwise use live)
             signal_values = {}
@@ -2643,7 +2810,7 @@ class CANMonitor(QMainWindow):
                 b[7] = max(0, min(255, int(soc)))
 
             # Convert to hex string
-            hex_string = ' '.join(f"{x:02X}" for x in b)
+            hex_string = b.hex(' ').upper()
 
             # Update the hex display label
             if frame_id in self.hex_labels:
@@ -2932,7 +3099,7 @@ class CANMonitor(QMainWindow):
     def update_pcu_motor_hex(self, frame_id):
         """Custom encoder for PCU Motor Status frame (0x720)"""
         try:
-            b = [0] * 8
+            b = bytearray(8)
 
             # Collect all signal values (use modified if available, otherwise use live)
             signal_values = {}
@@ -3031,7 +3198,7 @@ class CANMonitor(QMainWindow):
             b[7] = failure
 
             # Convert to hex string
-            hex_string = bytes(b).hex(' ').upper()
+            hex_string = b.hex(' ').upper()
 
             # Update the hex input field
             if hasattr(self, 'pcu_inputs') and frame_id in self.pcu_inputs:
@@ -3051,7 +3218,7 @@ class CANMonitor(QMainWindow):
     def update_pcu_cooling_hex(self, frame_id):
         """Custom encoder for PCU Cooling frame (0x722)"""
         try:
-            b = [0] * 8
+            b = bytearray(8)
 
             # Collect all signal values (use modified if available, otherwise use live)
             signal_values = {}
@@ -3111,7 +3278,7 @@ class CANMonitor(QMainWindow):
                 b[7] = max(0, min(255, int(battery_temp + 40)))
 
             # Convert to hex string
-            hex_string = bytes(b).hex(' ').upper()
+            hex_string = b.hex(' ').upper()
 
             # Update the hex input field
             if hasattr(self, 'pcu_inputs') and frame_id in self.pcu_inputs:
@@ -3131,7 +3298,7 @@ class CANMonitor(QMainWindow):
     def update_pcu_power_hex(self, frame_id):
         """Custom encoder for PCU Power frame (0x724)"""
         try:
-            b = [0] * 8
+            b = bytearray(8)
 
             # Collect all signal values (use modified if available, otherwise use live)
             signal_values = {}
@@ -3206,7 +3373,7 @@ class CANMonitor(QMainWindow):
                 b[7] = (inv_current_unsigned >> 8) & 0xFF
 
             # Convert to hex string
-            hex_string = bytes(b).hex(' ').upper()
+            hex_string = b.hex(' ').upper()
 
             # Update the hex input field
             # Check if it's in pcu_inputs dictionary
@@ -3293,7 +3460,7 @@ class CANMonitor(QMainWindow):
 
         try:
             # Send a test message
-            test_msg = can.Message(arbitration_id=0x123, data=[0xAA, 0xBB, 0xCC, 0xDD], is_extended_id=False)
+            test_msg = can.Message(arbitration_id=0x123, data=b'\xAA\xBB\xCC\xDD', is_extended_id=False)
             self.bus2.send(test_msg)
             print("Sent test message on CAN2: 0x123 AA BB CC DD")
 
@@ -3318,7 +3485,7 @@ class CANMonitor(QMainWindow):
             self.connect_btn1.setStyleSheet("background:#c62828;color:white;")
             self.status_label1.setText("CAN1: CONNECTED")
             self.status_label1.setStyleSheet("color:green;font-weight:bold;")
-            threading.Thread(target=self.can_listener1, daemon=True).start()
+            self.notifier1 = self.start_listener(self.bus1, 1)
         except Exception as e:
             self.status_label1.setText(f"CAN1: ERROR: {str(e)[:30]}")
             print("CAN1 Connect failed:", e)
@@ -3332,8 +3499,8 @@ class CANMonitor(QMainWindow):
             self.connect_btn2.setStyleSheet("background:#c62828;color:white;")
             self.status_label2.setText("CAN2: CONNECTED")
             self.status_label2.setStyleSheet("color:green;font-weight:bold;")
-            print("CAN2 connected successfully, starting listener thread")  # Debug print
-            threading.Thread(target=self.can_listener2, daemon=True).start()
+            print("CAN2 connected successfully, starting listener")  # Debug print
+            self.notifier2 = self.start_listener(self.bus2, 2)
         except Exception as e:
             # Try alternative channels
             alt_channels = ['PCAN_USBBUS3', 'PCAN_USBBUS4', 'PCAN_USBBUS5', 'PCAN_USBBUS6']
@@ -3346,8 +3513,8 @@ class CANMonitor(QMainWindow):
                     self.connect_btn2.setStyleSheet("background:#c62828;color:white;")
                     self.status_label2.setText(f"CAN2: CONNECTED ({alt_channel})")
                     self.status_label2.setStyleSheet("color:green;font-weight:bold;")
-                    print(f"CAN2 connected successfully to {alt_channel}, starting listener thread")
-                    threading.Thread(target=self.can_listener2, daemon=True).start()
+                    print(f"CAN2 connected successfully to {alt_channel}, starting listener")
+                    self.notifier2 = self.start_listener(self.bus2, 2)
                     return
                 except:
                     continue
@@ -3367,6 +3534,9 @@ class CANMonitor(QMainWindow):
         for cid in EMULATOR_STATES:
             EMULATOR_STATES[cid] = False
         self.stop_all_timers()
+        if self.notifier1:
+            self.notifier1.stop()
+            self.notifier1 = None
         if self.bus1:
             try:
                 self.bus1.shutdown()
@@ -3383,7 +3553,11 @@ class CANMonitor(QMainWindow):
             with self.lock:
                 for d in self.signals.values():
                     d.clear()
+                self._dirty_fids.update(self.signals)
                 self.raw_log_lines.clear()
+            self._rx_frames.clear()
+            with self._rx_drop_lock:
+                self.rx_dropped = 0
 
     def disconnect_can2(self):
         global EMULATOR_BAT1_ENABLED
@@ -3391,6 +3565,9 @@ class CANMonitor(QMainWindow):
         for cid in EMULATOR_STATES:
             EMULATOR_STATES[cid] = False
         self.stop_all_timers()
+        if self.notifier2:
+            self.notifier2.stop()
+            self.notifier2 = None
         if self.bus2:
             try:
                 self.bus2.shutdown()
@@ -3407,7 +3584,11 @@ class CANMonitor(QMainWindow):
             with self.lock:
                 for d in self.signals.values():
                     d.clear()
+                self._dirty_fids.update(self.signals)
                 self.raw_log_lines.clear()
+            self._rx_frames.clear()
+            with self._rx_drop_lock:
+                self.rx_dropped = 0
 
     def create_retainvar_placeholder_tab(self):
         """Create a placeholder tab when retainvar is not available"""
@@ -3769,7 +3950,7 @@ class CANMonitor(QMainWindow):
     def retainvar_add_message_to_list(self, message, timestamp):
         """Add received CAN message to the table"""
         self.retainvar_message_count += 1
-        self.retainvar_last_message_time = time.time()
+        self.retainvar_last_message_time = time.monotonic()
 
         can_id = message.id
 
@@ -3794,27 +3975,26 @@ class CANMonitor(QMainWindow):
 
         self.retainvar_message_table.setRowCount(0)
 
+        # Bind the message types once for the per-row comparisons
+        mt_extended = MessageType.MSGTYPE_EXTENDED
+        mt_rtr = MessageType.MSGTYPE_RTR
+
         for can_id, data in self.retainvar_can_id_map.items():
             message = data['message']
             count = data['count']
             last_update = data['last_update']
 
-            # Determine message type
-            if message.msgtype == MessageType.MSGTYPE_EXTENDED:
+            # Determine message type and format CAN ID
+            msgtype = message.msgtype
+            if msgtype == mt_extended:
                 msg_type = "EXT"
-            elif message.msgtype == MessageType.MSGTYPE_RTR:
-                msg_type = "RTR"
-            else:
-                msg_type = "STD"
-
-            # Format CAN ID
-            if message.msgtype == MessageType.MSGTYPE_EXTENDED:
                 msg_id = f"{message.id:08X}"
             else:
+                msg_type = "RTR" if msgtype == mt_rtr else "STD"
                 msg_id = f"{message.id:03X}"
 
             # Format data
-            data_str = ' '.join([f'{b:02X}' for b in message.data])
+            data_str = message.data.hex(' ').upper()
 
             # Format timestamp
             time_str = time.strftime("%H:%M:%S", time.localtime(last_update))
@@ -3830,7 +4010,7 @@ class CANMonitor(QMainWindow):
 
     def retainvar_update_status_display(self):
         """Update the status display"""
-        time_since_last = time.time() - self.retainvar_last_message_time
+        time_since_last = time.monotonic() - self.retainvar_last_message_time
 
         if time_since_last < 1.0:
             status = f"Connected - Monitoring CAN bus... Messages: {self.retainvar_message_count}"
@@ -3850,7 +4030,7 @@ class CANMonitor(QMainWindow):
         self.retainvar_message_table.setRowCount(0)
         self.retainvar_message_count = 0
         self.retainvar_can_id_map.clear()
-        self.retainvar_last_message_time = time.time()
+        self.retainvar_last_message_time = time.monotonic()
         self.retainvar_update_status_display()
 
 
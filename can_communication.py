@@ -7,11 +7,18 @@ programming various electronic control units (ECUs) in marine propulsion systems
 """
 
 import time
+import queue
+import socket
+import threading
 import struct
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple, Callable
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 
 try:
     import can
@@ -23,6 +30,91 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Kernel receive buffer requested for SocketCAN sockets (bytes)
+SOCKETCAN_RCVBUF_SIZE = 1 << 20
+
+# Channel name prefix -> python-can interface, checked in order
+CHANNEL_INTERFACE_PREFIXES = (
+    ('PCAN', 'pcan'),
+    ('can', 'socketcan'),
+    ('vcan', 'socketcan'),
+)
+DEFAULT_INTERFACE = 'pcan'
+
+# How long a send may wait for room in the driver's transmit queue (seconds);
+# SocketCAN otherwise fails immediately once its small txqueuelen is full
+TX_QUEUE_TIMEOUT = 0.1
+
+# Pause before the notifier thread receives again after a bus error, so a
+# persistent fault cannot spin it (seconds)
+RX_ERROR_BACKOFF = 0.1
+
+# Frames the receive buffer holds for receive_* callers; when nobody reads
+# them the oldest are dropped instead of growing memory for the whole session
+RX_BUFFER_SIZE = 10000
+
+# Shared all-zero payload for bootloader command frames
+_ZERO8 = bytes(8)
+
+# Retain read responses carry the value in bytes 4-7; the low bits of byte 0
+# select a signed width, anything else is read as unsigned 32-bit
+_SIGNED_VALUE_STRUCTS = {
+    0x01: struct.Struct('<b'),  # 8-bit signed
+    0x02: struct.Struct('<h'),  # 16-bit signed
+    0x04: struct.Struct('<i'),  # 32-bit signed
+}
+_UNSIGNED_VALUE_STRUCT = struct.Struct('<I')
+
+# Sign bit per signed data type, for decoding whole bursts arithmetically
+_VALUE_SIGN_BITS = {0x01: 0x80, 0x02: 0x8000, 0x04: 0x80000000}
+
+# Retain read/write request: command byte (0x10/0x20 + length) in the low
+# byte of the first word above a 24-bit address, then the 32-bit value
+_RETAIN_REQUEST = struct.Struct('<II')
+_RETAIN_READ = 0x10
+_RETAIN_WRITE = 0x20
+
+
+def _probe_interfaces() -> Tuple[str, ...]:
+    """
+    Probe which python-can interface backends are importable
+
+    Returns:
+        Tuple of channel names offered by the available backends
+    """
+    interfaces = []
+
+    # Try PCAN interfaces
+    try:
+        import can.interfaces.pcan
+        pcan_channels = ['PCAN_USBBUS1', 'PCAN_USBBUS2', 'PCAN_USBBUS3', 'PCAN_USBBUS4',
+                       'PCAN_ISABUS1', 'PCAN_ISABUS2', 'PCAN_PCIBUS1', 'PCAN_PCIBUS2']
+        interfaces.extend(pcan_channels)
+    except ImportError:
+        pass
+
+    # Try SocketCAN (Linux)
+    try:
+        import can.interfaces.socketcan
+        socketcan_channels = ['can0', 'can1', 'can2', 'can3']
+        interfaces.extend(socketcan_channels)
+    except ImportError:
+        pass
+
+    # Try Vector interfaces
+    try:
+        import can.interfaces.vector
+        vector_channels = ['0', '1', '2', '3']
+        interfaces.extend(vector_channels)
+    except ImportError:
+        pass
+
+    return tuple(interfaces)
+
+
+# Installed backends do not change while running, so probe them once
+_AVAILABLE_INTERFACES = _probe_interfaces()
+
 
 class HardwareType(Enum):
     """Hardware types corresponding to different PCAN adapters"""
@@ -79,19 +171,40 @@ class MessageType(Enum):
     MSGTYPE_STATUS = 0x80
 
 
-@dataclass
+# Enum members bound once so the per-frame paths use identity checks
+# instead of MessageType attribute lookups and Enum.__eq__
+_MT_STANDARD = MessageType.MSGTYPE_STANDARD
+_MT_RTR = MessageType.MSGTYPE_RTR
+_MT_EXTENDED = MessageType.MSGTYPE_EXTENDED
+
+
 class CANMessage:
-    """CAN message structure"""
-    id: int
-    data: List[int]
-    msgtype: MessageType = MessageType.MSGTYPE_STANDARD
-    length: int = 8
-
-    def __post_init__(self):
-        if len(self.data) > 8:
+    """CAN message structure
+
+    Uses __slots__ and an immutable bytes payload so that the per-frame
+    allocation on the RX/TX paths stays as small as possible.
+    """
+    __slots__ = ('id', 'data', 'msgtype', 'length')
+
+    def __init__(self, id: int, data: bytes = b'',
+                 msgtype: MessageType = MessageType.MSGTYPE_STANDARD):
+        if len(data) > 8:
             raise ValueError("CAN message data cannot exceed 8 bytes")
+        self.id = id
+        self.data = bytes(data)
+        self.msgtype = msgtype
         self.length = len(self.data)
 
+    def __repr__(self) -> str:
+        return (f"CANMessage(id=0x{self.id:03X}, data={self.data.hex(' ').upper()}, "
+                f"msgtype={self.msgtype}, length={self.length})")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CANMessage):
+            return NotImplemented
+        return (self.id == other.id and self.data == other.data
+                and self.msgtype == other.msgtype)
+
 
 @dataclass
 class CANTimestamp:
@@ -101,6 +214,118 @@ class CANTimestamp:
     micros: int = 0
 
 
+class ResponseWaiter:
+    """
+    Collects frames with one arbitration ID as the notifier thread sees them
+
+    Registered through CANCommunication.expect_response so request/response
+    exchanges wake up as soon as the reply arrives instead of polling.
+    """
+    __slots__ = ('arbitration_id', '_frames', '_event')
+
+    def __init__(self, arbitration_id: int):
+        self.arbitration_id = arbitration_id
+        self._frames = deque()
+        self._event = threading.Event()
+
+    def __call__(self, msg: 'can.Message') -> None:
+        # Runs on the notifier thread
+        self._frames.append(msg)
+        self._event.set()
+
+    def get(self, timeout: float) -> Optional['can.Message']:
+        """
+        Wait for the next matching frame
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            The python-can message, or None on timeout
+        """
+        frames = self._frames
+        event = self._event
+        deadline = time.monotonic() + timeout
+        while not frames:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not event.wait(remaining):
+                return None
+            event.clear()
+        return frames.popleft()
+
+
+class _ReceiveBuffer(can.Listener):
+    """
+    Bounded buffer of received frames that keeps its notifier running
+
+    Frames are only read by the receive_* calls; variable reads and device
+    programming are served by ResponseWaiters, so the buffer drops its
+    oldest frame when full and counts the drops instead of growing.
+
+    The notifier stops its thread on an exception from bus.recv unless a
+    listener handles it; this one records the error for the next empty
+    receive to report, then lets reception continue.
+    """
+
+    def __init__(self, maxlen: int = RX_BUFFER_SIZE):
+        self._frames = deque(maxlen=maxlen)
+        self._event = threading.Event()
+        self._lock = threading.Lock()  # Guards error and dropped
+        self.error = None
+        self.dropped = 0
+
+    def on_message_received(self, msg: 'can.Message') -> None:
+        # Runs on the notifier thread
+        frames = self._frames
+        if len(frames) == frames.maxlen:
+            with self._lock:
+                self.dropped += 1
+        frames.append(msg)
+        self._event.set()
+
+    def take_faults(self) -> Tuple[Optional[Exception], int]:
+        """
+        Take the last bus error and the drop count, resetting both
+
+        Returns:
+            Tuple of (error or None, frames dropped)
+        """
+        with self._lock:
+            error, dropped = self.error, self.dropped
+            self.error = None
+            self.dropped = 0
+        return error, dropped
+
+    def get_message(self, timeout: float) -> Optional['can.Message']:
+        """
+        Take the oldest buffered frame, waiting up to timeout for one
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            The python-can message, or None on timeout
+        """
+        frames = self._frames
+        event = self._event
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return frames.popleft()
+            except IndexError:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not event.wait(remaining):
+                return None
+            event.clear()
+
+    def on_error(self, exc: Exception) -> None:
+        # Runs on the notifier thread
+        with self._lock:
+            self.error = exc
+        time.sleep(RX_ERROR_BACKOFF)
+
+
 class CANError(Exception):
     """Custom exception for CAN communication errors"""
     pass
@@ -120,49 +345,82 @@ class CANCommunication:
         Returns:
             List of available interface names
         """
-        interfaces = []
+        return list(_AVAILABLE_INTERFACES)
 
-        # Try PCAN interfaces
-        try:
-            import can.interfaces.pcan
-            pcan_channels = ['PCAN_USBBUS1', 'PCAN_USBBUS2', 'PCAN_USBBUS3', 'PCAN_USBBUS4',
-                           'PCAN_ISABUS1', 'PCAN_ISABUS2', 'PCAN_PCIBUS1', 'PCAN_PCIBUS2']
-            interfaces.extend(pcan_channels)
-        except ImportError:
-            pass
-
-        # Try SocketCAN (Linux)
-        try:
-            import can.interfaces.socketcan
-            socketcan_channels = ['can0', 'can1', 'can2', 'can3']
-            interfaces.extend(socketcan_channels)
-        except ImportError:
-            pass
+    @staticmethod
+    def probe_channels(channels: Optional[List[str]] = None,
+                       baudrate: BaudRate = BaudRate.BAUD_250K,
+                       max_workers: int = 8) -> Dict[str, CANResult]:
+        """
+        Try to open each channel and report which ones connect
 
-        # Try Vector interfaces
-        try:
-            import can.interfaces.vector
-            vector_channels = ['0', '1', '2', '3']
-            interfaces.extend(vector_channels)
-        except ImportError:
-            pass
+        Driver initialisation blocks per channel, so the channels are opened
+        concurrently and the total wait is roughly that of the slowest one
+        rather than the sum of all of them.
+
+        Args:
+            channels: Channels to probe (None = list_available_interfaces())
+            baudrate: CAN baud rate
+            max_workers: Maximum number of channels opened at once
+
+        Returns:
+            Dict mapping each channel to its connect() result
+        """
+        if channels is None:
+            channels = list(_AVAILABLE_INTERFACES)
+
+        def probe(channel):
+            comm = CANCommunication(channel, baudrate)
+            result = comm.connect()
+            if result == CANResult.ERR_OK:
+                comm.disconnect()
+            return result
+
+        if not channels:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(channels))) as executor:
+            return dict(zip(channels, executor.map(probe, channels)))
+
+    @staticmethod
+    def interface_for_channel(channel: str) -> str:
+        """
+        Map a channel name to its python-can interface
+
+        Args:
+            channel: CAN interface channel (e.g., 'PCAN_USBBUS1', 'can0')
 
-        return interfaces
+        Returns:
+            python-can interface name
+        """
+        for prefix, interface in CHANNEL_INTERFACE_PREFIXES:
+            if channel.startswith(prefix):
+                return interface
+        return DEFAULT_INTERFACE  # Default to pcan for compatibility
 
-    def __init__(self, channel: str = 'PCAN_USBBUS1', baudrate: BaudRate = BaudRate.BAUD_250K):
+    def __init__(self, channel: str = 'PCAN_USBBUS1', baudrate: BaudRate = BaudRate.BAUD_250K,
+                 tx_batch_size: int = 4, tx_batch_delay: float = 0.0):
         """
         Initialize CAN communication
 
         Args:
             channel: CAN interface channel (e.g., 'PCAN_USBBUS1', 'can0')
             baudrate: CAN baud rate
+            tx_batch_size: Messages send_messages writes before pausing
+            tx_batch_delay: Pause between send_messages batches in seconds
+                (0 = rely on the driver queue wait only)
         """
         self.channel = channel
         self.baudrate = baudrate.value
+        self.tx_batch_size = tx_batch_size
+        self.tx_batch_delay = tx_batch_delay
         self.bus = None
         self.is_connected = False
         self.message_filter = None
-        self.last_messages = []
+        self.response_filter = None
+        self._reader = None
+        self._notifier = None
+        self._waiters = {}  # Response ID -> tuple of ResponseWaiters
+        self._waiters_lock = threading.Lock()
 
     def connect(self) -> CANResult:
         """
@@ -173,13 +431,7 @@ class CANCommunication:
         """
         try:
             # Determine interface type
-            if self.channel.startswith('PCAN'):
-                interface = 'pcan'
-            elif self.channel.startswith('can'):
-                interface = 'socketcan'
-            else:
-                # Try to auto-detect interface
-                interface = 'pcan'  # Default to pcan for compatibility
+            interface = self.interface_for_channel(self.channel)
 
             # Configure CAN interface with updated API
             self.bus = can.interface.Bus(
@@ -187,6 +439,15 @@ class CANCommunication:
                 interface=interface,  # Use 'interface' instead of deprecated 'bustype'
                 bitrate=self.baudrate
             )
+            if interface == 'socketcan':
+                self._set_socket_rcvbuf(SOCKETCAN_RCVBUF_SIZE)
+            if self.message_filter or self.response_filter:
+                self._apply_message_filter()
+
+            # Drain the driver queue continuously on a background thread so
+            # frames are not lost while the caller is busy elsewhere
+            self._reader = _ReceiveBuffer()
+            self._notifier = can.Notifier(self.bus, [self._reader, self._dispatch_response])
             self.is_connected = True
             logger.info(f"Connected to CAN bus: {self.channel} at {self.baudrate} bps")
             return CANResult.ERR_OK
@@ -206,6 +467,10 @@ class CANCommunication:
             CANResult: Disconnection status
         """
         try:
+            if self._notifier:
+                self._notifier.stop()
+                self._notifier = None
+            self._reader = None
             if self.bus:
                 self.bus.shutdown()
                 self.bus = None
@@ -234,19 +499,79 @@ class CANCommunication:
             can_msg = can.Message(
                 arbitration_id=message.id,
                 data=message.data,
-                is_extended_id=(message.msgtype == MessageType.MSGTYPE_EXTENDED),
-                is_remote_frame=(message.msgtype == MessageType.MSGTYPE_RTR)
+                is_extended_id=(message.msgtype is _MT_EXTENDED),
+                is_remote_frame=(message.msgtype is _MT_RTR)
             )
 
             # Send message
-            self.bus.send(can_msg)
-            logger.debug(f"Sent CAN message: ID=0x{message.id:03X}, Data={message.data}")
+            self.bus.send(can_msg, TX_QUEUE_TIMEOUT)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sent CAN message: ID=0x%03X, Data=%s", message.id, message.data.hex(' '))
             return CANResult.ERR_OK
 
         except Exception as e:
             logger.error(f"Error sending CAN message: {e}")
             return CANResult.ERR_XMTFULL
 
+    def send_messages(self, messages: List[CANMessage]) -> CANResult:
+        """
+        Send several CAN messages back-to-back
+
+        Each send waits for room in the driver's transmit queue, and with a
+        tx_batch_delay set the burst is paced in groups of tx_batch_size so
+        controller mailboxes are not overrun.
+
+        Args:
+            messages: CAN messages to send, in order
+
+        Returns:
+            CANResult: ERR_OK if all were sent, else the status of the first failure
+        """
+        if not self.is_connected or not self.bus:
+            return CANResult.ERR_ILLHW
+
+        send = self.bus.send
+        Message = can.Message
+        batch_size = self.tx_batch_size
+        batch_delay = self.tx_batch_delay
+        try:
+            for count, message in enumerate(messages, 1):
+                send(Message(
+                    arbitration_id=message.id,
+                    data=message.data,
+                    is_extended_id=(message.msgtype is _MT_EXTENDED),
+                    is_remote_frame=(message.msgtype is _MT_RTR)
+                ), TX_QUEUE_TIMEOUT)
+                if batch_delay and count % batch_size == 0 and count < len(messages):
+                    time.sleep(batch_delay)
+            return CANResult.ERR_OK
+        except Exception as e:
+            logger.error(f"Error sending CAN message: {e}")
+            return CANResult.ERR_XMTFULL
+
+    def send_frame(self, can_msg: 'can.Message') -> CANResult:
+        """
+        Send a prebuilt python-can message
+
+        Lets hot paths reuse a single can.Message instead of going through
+        the CANMessage conversion in send_message.
+
+        Args:
+            can_msg: python-can message to send
+
+        Returns:
+            CANResult: Send status
+        """
+        if not self.is_connected or not self.bus:
+            return CANResult.ERR_ILLHW
+
+        try:
+            self.bus.send(can_msg, TX_QUEUE_TIMEOUT)
+            return CANResult.ERR_OK
+        except Exception as e:
+            logger.error(f"Error sending CAN message: {e}")
+            return CANResult.ERR_XMTFULL
+
     def receive_message(self, timeout: float = 0.1) -> Tuple[CANResult, Optional[CANMessage], Optional[CANTimestamp]]:
         """
         Receive a CAN message
@@ -257,43 +582,206 @@ class CANCommunication:
         Returns:
             Tuple of (result, message, timestamp)
         """
-        if not self.is_connected or not self.bus:
+        reader = self._reader
+        if not self.is_connected or not reader:
             return CANResult.ERR_ILLHW, None, None
 
-        try:
-            # Receive message
-            can_msg = self.bus.recv(timeout)
+        # Bus errors are raised on the notifier thread, not here, so the
+        # common path needs no exception handling; errors are only looked
+        # for once the buffer comes back empty
+        can_msg = reader.get_message(timeout)
+        if can_msg is None:
+            return self._empty_result(), None, None
+
+        message, timestamp = self._convert_message(can_msg)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received CAN message: ID=0x%03X, Data=%s", message.id, message.data.hex(' '))
+        return CANResult.ERR_OK, message, timestamp
+
+    def receive_message_view(self, timeout: float = 0.1) -> Tuple[CANResult, Optional[int], Optional[memoryview], Optional[MessageType], Optional[CANTimestamp]]:
+        """
+        Receive a CAN message without copying its payload
+
+        Returns the python-can buffer through a memoryview instead of
+        wrapping it in a CANMessage. The view stays valid because each
+        received frame owns its own buffer.
+
+        Args:
+            timeout: Receive timeout in seconds
 
+        Returns:
+            Tuple of (result, arbitration_id, data view, msgtype, timestamp)
+        """
+        reader = self._reader
+        if not self.is_connected or not reader:
+            return CANResult.ERR_ILLHW, None, None, None, None
+
+        can_msg = reader.get_message(timeout)
+        if can_msg is None:
+            return self._empty_result(), None, None, None, None
+
+        if can_msg.is_extended_id:
+            msgtype = _MT_EXTENDED
+        elif can_msg.is_remote_frame:
+            msgtype = _MT_RTR
+        else:
+            msgtype = _MT_STANDARD
+
+        millis, micros = divmod(int(can_msg.timestamp * 1000000), 1000)
+        timestamp = CANTimestamp(millis=millis, micros=micros)
+        return CANResult.ERR_OK, can_msg.arbitration_id, memoryview(can_msg.data), msgtype, timestamp
+
+    def receive_batch(self, max_n: int = 256, timeout: float = 0.1) -> Tuple[CANResult, List[Tuple[CANMessage, CANTimestamp]]]:
+        """
+        Receive a burst of CAN messages
+
+        Blocks up to ``timeout`` for the first frame, then drains whatever is
+        already queued without waiting, so the per-call overhead is paid once
+        per burst instead of once per frame.
+
+        Args:
+            max_n: Maximum number of messages to return
+            timeout: Receive timeout in seconds for the first message
+
+        Returns:
+            Tuple of (result, list of (message, timestamp))
+        """
+        reader = self._reader
+        if not self.is_connected or not reader:
+            return CANResult.ERR_ILLHW, []
+
+        batch = []
+        recv = reader.get_message
+        convert = self._convert_message
+        append = batch.append
+
+        can_msg = recv(timeout)
+        if can_msg is None:
+            return self._empty_result(), batch
+
+        append(convert(can_msg))
+        while len(batch) < max_n:
+            can_msg = recv(0.0)
             if can_msg is None:
-                return CANResult.ERR_QRCVEMPTY, None, None
-
-            # Debug logging for received messages (only errors and warnings)
-            # logger.debug(f"CAN message received: ID=0x{can_msg.arbitration_id:03X}, Data={[f'{b:02X}' for b in can_msg.data]}")
-
-            # Convert to our message format
-            msgtype = MessageType.MSGTYPE_STANDARD
-            if can_msg.is_extended_id:
-                msgtype = MessageType.MSGTYPE_EXTENDED
-            elif can_msg.is_remote_frame:
-                msgtype = MessageType.MSGTYPE_RTR
-
-            message = CANMessage(
-                id=can_msg.arbitration_id,
-                data=list(can_msg.data),
-                msgtype=msgtype
-            )
+                break
+            append(convert(can_msg))
 
-            timestamp = CANTimestamp(
-                millis=int(can_msg.timestamp * 1000),
-                micros=int((can_msg.timestamp * 1000000) % 1000)
-            )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received CAN batch: %d messages", len(batch))
+        return CANResult.ERR_OK, batch
 
-            logger.debug(f"Received CAN message: ID=0x{message.id:03X}, Data={message.data}")
-            return CANResult.ERR_OK, message, timestamp
+    def _empty_result(self) -> CANResult:
+        """
+        Classify an empty receive buffer
 
-        except Exception as e:
-            logger.error(f"Error receiving CAN message: {e}")
-            return CANResult.ERR_OVERRUN, None, None
+        Returns:
+            CANResult: ERR_OVERRUN once for each bus error the notifier
+            thread hit, or buffer overflow, since the last call;
+            ERR_QRCVEMPTY otherwise
+        """
+        reader = self._reader
+        if reader is None:
+            return CANResult.ERR_QRCVEMPTY
+        error, dropped = reader.take_faults()
+        if error is not None:
+            logger.error(f"Error receiving CAN message: {error}")
+        if dropped:
+            logger.warning(f"Receive buffer full, dropped {dropped} CAN messages")
+        if error is not None or dropped:
+            return CANResult.ERR_OVERRUN
+        return CANResult.ERR_QRCVEMPTY
+
+    def _set_socket_rcvbuf(self, size: int) -> None:
+        """
+        Enlarge the kernel receive buffer of a SocketCAN bus
+
+        Args:
+            size: Requested SO_RCVBUF size in bytes
+        """
+        sock = getattr(self.bus, 'socket', None)
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, size)
+        except OSError as e:
+            logger.warning(f"Could not set SocketCAN receive buffer size: {e}")
+
+    @staticmethod
+    def _convert_message(can_msg: 'can.Message') -> Tuple[CANMessage, CANTimestamp]:
+        """
+        Convert a python-can message to our message and timestamp format
+
+        Args:
+            can_msg: Message returned by the python-can bus
+
+        Returns:
+            Tuple of (message, timestamp)
+        """
+        if can_msg.is_extended_id:
+            msgtype = _MT_EXTENDED
+        elif can_msg.is_remote_frame:
+            msgtype = _MT_RTR
+        else:
+            msgtype = _MT_STANDARD
+
+        message = CANMessage(
+            id=can_msg.arbitration_id,
+            data=can_msg.data,
+            msgtype=msgtype
+        )
+
+        # One float multiply, then split into whole milliseconds and the
+        # microseconds within that millisecond (PCANLight TPCANTimestamp layout)
+        millis, micros = divmod(int(can_msg.timestamp * 1000000), 1000)
+        timestamp = CANTimestamp(millis=millis, micros=micros)
+        return message, timestamp
+
+    def expect_response(self, response_id: int) -> ResponseWaiter:
+        """
+        Start collecting frames with the given ID
+
+        Register before sending the request so a fast reply cannot be missed,
+        and pair with release_response once done. Several waiters may share
+        an ID; each one receives every matching frame.
+
+        Args:
+            response_id: Arbitration ID of the expected response
+
+        Returns:
+            ResponseWaiter: Waiter fed by the notifier thread
+        """
+        waiter = ResponseWaiter(response_id)
+        # Tuples are replaced rather than mutated, so the notifier thread
+        # can iterate them without taking the lock
+        with self._waiters_lock:
+            self._waiters[response_id] = self._waiters.get(response_id, ()) + (waiter,)
+        return waiter
+
+    def release_response(self, waiter: ResponseWaiter) -> None:
+        """
+        Stop collecting frames for a waiter returned by expect_response
+
+        Args:
+            waiter: Waiter to unregister
+        """
+        response_id = waiter.arbitration_id
+        with self._waiters_lock:
+            remaining = tuple(w for w in self._waiters.get(response_id, ()) if w is not waiter)
+            if remaining:
+                self._waiters[response_id] = remaining
+            else:
+                self._waiters.pop(response_id, None)
+
+    def _dispatch_response(self, msg: 'can.Message') -> None:
+        """
+        Notifier callback routing frames to registered response waiters
+
+        Args:
+            msg: Message received by the notifier thread
+        """
+        for waiter in self._waiters.get(msg.arbitration_id, ()):
+            waiter(msg)
 
     def set_message_filter(self, from_id: int, to_id: int, msg_type: MessageType) -> CANResult:
         """
@@ -307,16 +795,90 @@ class CANCommunication:
         Returns:
             CANResult: Filter setting status
         """
-        # Note: python-can filtering is more limited than PCANLight
-        # This is a simplified implementation
         self.message_filter = {
             'from_id': from_id,
             'to_id': to_id,
             'msg_type': msg_type
         }
         logger.info(f"Set message filter: 0x{from_id:03X} - 0x{to_id:03X}, Type: {msg_type}")
+        if self.is_connected and self.bus:
+            return self._apply_message_filter()
+        return CANResult.ERR_OK
+
+    def set_response_filter(self, response_ids: Optional[List[int]]) -> CANResult:
+        """
+        Accept the given standard IDs in addition to any message filter
+
+        Once either filter is set, the driver drops every frame that matches
+        neither of them.
+
+        Args:
+            response_ids: Exact CAN IDs to accept (None = clear)
+
+        Returns:
+            CANResult: Filter setting status
+        """
+        self.response_filter = list(response_ids) if response_ids else None
+        if self.is_connected and self.bus:
+            return self._apply_message_filter()
         return CANResult.ERR_OK
 
+    def _apply_message_filter(self) -> CANResult:
+        """
+        Push the stored message and response filters down to the bus driver
+
+        python-can hands the filters to the kernel/hardware where supported
+        and matches them in software in Bus.recv otherwise, so unwanted
+        frames never reach the receive queue either way.
+
+        Returns:
+            CANResult: Filter setting status
+        """
+        filters = []
+        flt = self.message_filter
+        if flt:
+            extended = flt['msg_type'] is _MT_EXTENDED
+            filters.extend(self._range_filters(flt['from_id'], flt['to_id'], extended))
+        if self.response_filter:
+            filters.extend({'can_id': response_id, 'can_mask': 0x7FF, 'extended': False}
+                           for response_id in self.response_filter)
+        try:
+            self.bus.set_filters(filters or None)
+        except Exception as e:
+            logger.error(f"Failed to apply message filter: {e}")
+            return CANResult.ERR_PARMVAL
+        return CANResult.ERR_OK
+
+    @staticmethod
+    def _range_filters(from_id: int, to_id: int, extended: bool) -> List[Dict]:
+        """
+        Cover an ID range exactly with python-can id/mask filters
+
+        The range is split into aligned power-of-two blocks, each of which
+        is a single can_id/can_mask pair.
+
+        Args:
+            from_id: Start of ID range
+            to_id: End of ID range (inclusive)
+            extended: Match 29-bit instead of 11-bit identifiers
+
+        Returns:
+            List of python-can filter dicts
+        """
+        id_mask = 0x1FFFFFFF if extended else 0x7FF
+        filters = []
+        while from_id <= to_id:
+            size = (from_id & -from_id) or (id_mask + 1)
+            while from_id + size - 1 > to_id:
+                size >>= 1
+            filters.append({
+                'can_id': from_id,
+                'can_mask': id_mask & ~(size - 1),
+                'extended': extended
+            })
+            from_id += size
+        return filters
+
     def get_status(self) -> CANResult:
         """
         Get CAN bus status
@@ -362,6 +924,15 @@ class BootloaderProtocol:
     BSI_EEPROM_WR = 0x01
     BSI_EEPROM_RD = 0x02
 
+    # Upload geometry: 4 words per data frame, 32 words (64 bytes) per address block
+    FRAME_WORDS = 4
+    BLOCK_WORDS = 32
+
+    # Upload blocks buffered between program_device and the sender thread
+    TX_QUEUE_BLOCKS = 64
+    # Extra attempts at a block (address frame + data frames) after a send error
+    BLOCK_RETRIES = 1
+
     def __init__(self, can_comm: CANCommunication):
         """
         Initialize bootloader protocol
@@ -376,6 +947,13 @@ class BootloaderProtocol:
         self.data_bytes = None
         self.data_ptr = None
 
+        # Staging buffer for queue_block: one struct pack per 64-byte block
+        self._block_buf = bytearray(self.BLOCK_WORDS * 2)
+        self._block_struct = struct.Struct(f'<{self.BLOCK_WORDS}H')
+
+        # First error reported by the upload sender thread, if any
+        self._tx_error = None
+
     def send_command(self, command_id: int) -> CANResult:
         """
         Send a bootloader command
@@ -388,7 +966,7 @@ class BootloaderProtocol:
         """
         message = CANMessage(
             id=command_id,
-            data=[0x00] * 8,
+            data=_ZERO8,
             msgtype=MessageType.MSGTYPE_STANDARD
         )
 
@@ -414,11 +992,7 @@ class BootloaderProtocol:
         """
         message = CANMessage(
             id=address_id,
-            data=[
-                address & 0xFF,
-                (address >> 8) & 0xFF,
-                0x00, 0x00, 0x00, 0x00, 0x00, 0x00
-            ],
+            data=struct.pack('<H6x', address & 0xFFFF),
             msgtype=MessageType.MSGTYPE_STANDARD
         )
 
@@ -441,41 +1015,176 @@ class BootloaderProtocol:
         Returns:
             CANResult: Send status
         """
-        if not self.data_ptr or not self.data_bytes:
+        if self.data_ptr is None or not self.data_bytes:
             return CANResult.ERR_PARMVAL
 
-        message = CANMessage(
-            id=data_id,
-            data=[],
-            msgtype=MessageType.MSGTYPE_STANDARD
-        )
-
-        # Fill message with 8 bytes of data (4 words)
-        for i in range(8):
-            if self.data_ptr < len(self.data_bytes):
-                # Pack 16-bit words into bytes (little-endian)
-                word = self.data_bytes[self.data_ptr]
-                if i % 2 == 0:
-                    message.data.append(word & 0xFF)
-                else:
-                    message.data.append((word >> 8) & 0xFF)
-                    self.data_ptr += 1
-            else:
-                message.data.append(0xFF)
+        # Fill message with 8 bytes of data (4 little-endian words),
+        # padding past the end of the image with erased flash (0xFFFF)
+        words = self.data_bytes[self.data_ptr:self.data_ptr + self.FRAME_WORDS]
+        sent = len(words)
+        words += [0xFFFF] * (self.FRAME_WORDS - sent)
+        message = can.Message(arbitration_id=data_id, data=struct.pack('<4H', *words),
+                              is_extended_id=False)
 
-        result = self.can.send_message(message)
+        result = self.can.send_frame(message)
         if result == CANResult.ERR_OK:
+            self.data_ptr += sent
             # Check if we've sent 64 bytes (8 messages * 8 bytes)
-            addr_offset = (self.data_ptr * 2) - (len(self.data_bytes) * 2 if hasattr(self, 'start_addr') else 0)
-            if addr_offset % 64 == 0:
+            if self.data_ptr % self.BLOCK_WORDS == 0:
                 self.upload_step -= 1
-                self.pic_address += 64
+                self.pic_address += self.BLOCK_WORDS * 2
         else:
             logger.error("CAN communication error during data send")
-            self.data_ptr -= 8  # Rewind on error
 
         return result
 
+    def send_block(self, address_id: int, data_id: int) -> CANResult:
+        """
+        Send one address frame followed by a full 64-byte data block
+
+        Equivalent to send_address plus BLOCK_WORDS / FRAME_WORDS calls to
+        send_data, sent through the same path as program_device's blocks.
+
+        Args:
+            address_id: Address CAN ID
+            data_id: Data CAN ID
+
+        Returns:
+            CANResult: Send status
+        """
+        if self.data_ptr is None or not self.data_bytes:
+            return CANResult.ERR_PARMVAL
+
+        words = self.data_bytes[self.data_ptr:self.data_ptr + self.BLOCK_WORDS]
+        self._pack_block(words)
+        tx_buf = bytearray(8)
+        tx_msg = can.Message(arbitration_id=0, data=tx_buf, is_extended_id=False)
+        return self._transmit_block(tx_msg, tx_buf, address_id, self.pic_address,
+                                    data_id, bytes(self._block_buf))
+
+    def queue_block(self, tx_queue: queue.Queue, address_id: int, address: int,
+                    data_id: int, words: List[int]) -> CANResult:
+        """
+        Queue one address frame and 64-byte data block for the sender thread
+
+        Blocks while the queue is full, so the producer never runs more than
+        TX_QUEUE_BLOCKS ahead of the bus.
+
+        Args:
+            tx_queue: Queue drained by _sender_loop
+            address_id: Address CAN ID
+            address: Memory address of the block
+            data_id: Data CAN ID
+            words: Up to BLOCK_WORDS image words
+
+        Returns:
+            CANResult: First sender error so far, or ERR_OK once queued
+        """
+        if self._tx_error is not None:
+            return self._tx_error
+
+        self._pack_block(words)
+        tx_queue.put((address_id, address, data_id, bytes(self._block_buf)))
+        return CANResult.ERR_OK
+
+    def _sender_loop(self, tx_queue: queue.Queue) -> None:
+        """
+        Send queued upload blocks back-to-back until a None sentinel arrives
+
+        A failed block is resent from its address frame up to BLOCK_RETRIES
+        times. After that the remaining blocks are drained and dropped so the
+        producer never blocks on a full queue.
+
+        Args:
+            tx_queue: Queue filled by queue_block
+        """
+        ok = CANResult.ERR_OK
+        attempts = range(self.BLOCK_RETRIES + 1)
+        tx_buf = bytearray(8)
+        tx_msg = can.Message(arbitration_id=0, data=tx_buf, is_extended_id=False)
+
+        while True:
+            item = tx_queue.get()
+            if item is None:
+                return
+            if self._tx_error is not None:
+                continue
+
+            for _ in attempts:
+                result = self._transmit_block(tx_msg, tx_buf, *item)
+                if result == ok:
+                    break
+            else:
+                self._tx_error = result
+
+    def _transmit_block(self, tx_msg: 'can.Message', tx_buf: bytearray, address_id: int,
+                        address: int, data_id: int, block: bytes) -> CANResult:
+        """
+        Send one address frame and the data frames of a packed block
+
+        Keeps upload_step, pic_address and data_ptr in step with the
+        frames sent, as send_address and send_data do.
+
+        Args:
+            tx_msg: Reusable message whose data is tx_buf
+            tx_buf: 8-byte payload buffer of tx_msg
+            address_id: Address CAN ID
+            address: Memory address of the block
+            data_id: Data CAN ID
+            block: Packed 64-byte block
+
+        Returns:
+            CANResult: Send status
+        """
+        send_frame = self.can.send_frame
+        tx_msg.arbitration_id = address_id
+        struct.pack_into('<H6x', tx_buf, 0, address & 0xFFFF)
+        result = send_frame(tx_msg)
+        if result != CANResult.ERR_OK:
+            logger.error("CAN communication error during address send")
+            return result
+        self.upload_step += 1
+
+        tx_msg.arbitration_id = data_id
+        for offset in range(0, len(block), 8):
+            tx_buf[:] = block[offset:offset + 8]
+            result = send_frame(tx_msg)
+            if result != CANResult.ERR_OK:
+                logger.error("CAN communication error during data send")
+                self.upload_step -= 1  # The block is resent from its address frame
+                return result
+
+        self.upload_step -= 1
+        self.pic_address = address + len(block)
+        self.data_ptr = min(self.pic_address // 2, len(self.data_bytes))
+        return result
+
+    def _blocks(self):
+        """
+        Iterate over the loaded image in BLOCK_WORDS-sized blocks
+
+        Yields:
+            Tuple of (memory address, block words); the last block may be short
+        """
+        data = self.data_bytes
+        step = self.BLOCK_WORDS
+        for start in range(0, len(data), step):
+            yield start * 2, data[start:start + step]
+
+    def _pack_block(self, words: List[int]) -> None:
+        """
+        Pack one block of words into _block_buf
+
+        Words past the end of the image are padded with erased flash (0xFFFF).
+
+        Args:
+            words: Up to BLOCK_WORDS image words
+        """
+        padding = self.BLOCK_WORDS - len(words)
+        if padding:
+            words = words + [0xFFFF] * padding
+        self._block_struct.pack_into(self._block_buf, 0, *words)
+
     def load_hex_file(self, filename: str) -> bool:
         """
         Load and parse HEX file for programming
@@ -502,12 +1211,12 @@ class BootloaderProtocol:
                     record_type = int(line[7:9], 16)
 
                     if record_type == 0:  # Data record
-                        data_start = 9
-                        for i in range(byte_count // 2):  # 2 bytes per word
-                            word = int(line[data_start:data_start+4], 16)
-                            self.data_bytes.append(word)
-                            data_start += 4
-                            max_address = max(max_address, address + i * 2)
+                        # Decode the whole payload at once, 2 bytes per word
+                        raw = bytes.fromhex(line[9:9 + byte_count * 2])
+                        word_count = byte_count // 2
+                        if word_count:
+                            self.data_bytes.extend(struct.unpack_from(f'>{word_count}H', raw))
+                            max_address = max(max_address, address + (word_count - 1) * 2)
                     elif record_type == 1:  # End of file
                         break
 
@@ -533,9 +1242,17 @@ class BootloaderProtocol:
         if not self.load_hex_file(hex_file):
             return False
 
+        # Command IDs relative to the device base, resolved once
+        reset_id = device_id + 0
+        loading_id = device_id + 2
+        address_id = device_id + 3
+        data_id = device_id + 4
+        verify_id = device_id + 5
+        ok = CANResult.ERR_OK
+
         # Reset device
         logger.info("Resetting device...")
-        if self.send_command(device_id + 0) != CANResult.ERR_OK:
+        if self.send_command(reset_id) != ok:
             return False
 
         # Wait for bootloader start
@@ -543,32 +1260,102 @@ class BootloaderProtocol:
 
         # Send loading command
         logger.info("Starting firmware upload...")
-        if self.send_command(device_id + 2) != CANResult.ERR_OK:
+        if self.send_command(loading_id) != ok:
             return False
 
-        # Send data in chunks
+        # Send data in 64-byte blocks
         self.pic_address = 0
         self.upload_step = 4
-
-        while self.data_ptr < len(self.data_bytes):
-            # Send address
-            if self.send_address(device_id + 3, self.pic_address) != CANResult.ERR_OK:
-                return False
-
-            # Send 8 data messages (64 bytes)
-            for i in range(8):
-                if self.send_data(device_id + 4) != CANResult.ERR_OK:
-                    return False
+        queue_block = self.queue_block
+
+        # Pack blocks here while a sender thread keeps the bus busy
+        tx_queue = queue.Queue(maxsize=self.TX_QUEUE_BLOCKS)
+        self._tx_error = None
+        sender = threading.Thread(target=self._sender_loop, args=(tx_queue,), daemon=True)
+        sender.start()
+        result = ok
+        try:
+            for address, words in self._blocks():
+                # Queue address + 8 data messages (64 bytes)
+                result = queue_block(tx_queue, address_id, address, data_id, words)
+                if result != ok:
+                    break
+        finally:
+            tx_queue.put(None)
+            sender.join()
+
+        if result != ok or self._tx_error is not None:
+            self.upload_step = 0
+            return False
 
         # Send verify command
         logger.info("Verifying firmware...")
-        if self.send_command(device_id + 5) != CANResult.ERR_OK:
+        if self.send_command(verify_id) != ok:
             return False
 
         logger.info("Firmware programming completed successfully")
         return True
 
 
+# Retain variables shared by every board type (indices 0-21)
+_COMMON_VARIABLE_NAMES = (
+    "Flash CRC16", "Flash counter", "Supervisor key", "Admin key", "User key",
+    "Manuf. rev.", "Model", "Type", "Software rev.", "Hardware rev.",
+    "Date manuf.", "Date service", "Date current", "Log number", "Log index",
+    "Event number", "Event index", "Failure number", "Failure index", "Com ID",
+    "Com index", "Com type"
+)
+
+# "Mode ..." block that most boards place right after the common variables
+_MODE_VARIABLE_NAMES = (
+    "Mode init", "Mode option", "Mode verbose", "Mode debug", "Mode param"
+)
+
+# Retain table byte offsets all fit in one byte, so tables are stored as bytes
+_COMMON_TABLE_ADDR = bytes((
+    0, 2, 6, 10, 14, 18, 19, 20, 21, 22,
+    23, 27, 31, 35, 37, 39, 41, 43, 45, 47,
+    51, 52
+))
+
+# Complete tables shared by several board types; PCU and BMS are identical
+_TABLE_ADDR_PCU_BMS = _COMMON_TABLE_ADDR + bytes((
+    53, 54, 55, 56, 57, 58, 60, 62, 64, 66,
+    68, 70, 72, 74, 76, 77, 78, 79, 80, 81,
+    82, 83, 84, 85, 87, 91, 95, 99, 103
+))
+
+# SCU, FCU, CCU and PDU: one byte per variable after the common header
+_TABLE_ADDR_CONTIGUOUS = _COMMON_TABLE_ADDR + bytes(range(53, 82))
+
+
+@lru_cache(maxsize=None)
+def _variable_layout(table_addr: bytes) -> Tuple[bytes, Tuple[bytes, ...]]:
+    """
+    Derive per-variable lengths and read request payloads from a table
+
+    Cached per table, so boards sharing a table also share the derived data
+    and table_addr itself is only read once.
+
+    Args:
+        table_addr: Byte offsets of the board's retain variables
+
+    Returns:
+        Tuple of (lengths, read request payloads)
+    """
+    # Length is next address - current address (max 4), 4 for the last variable
+    last = len(table_addr) - 1
+    lengths = bytes(
+        min(4, table_addr[i + 1] - address) if i < last else 4
+        for i, address in enumerate(table_addr)
+    )
+    read_requests = tuple(
+        _RETAIN_REQUEST.pack((_RETAIN_READ + length) | (address << 8), 0)
+        for length, address in zip(lengths, table_addr)
+    )
+    return lengths, read_requests
+
+
 class BoardData:
     """
     Board-specific data structures and configurations
@@ -577,7 +1364,7 @@ class BoardData:
     TABLE_ADDR_MAX = 51
 
     # Board types
-    BOARD_TYPES = {
+    BOARD_TYPES = MappingProxyType({
         'PCU': 0,   # Power Control Unit
         'TCU': 1,   # Transmission Control Unit
         'WLU': 2,   # Water Level Unit
@@ -590,10 +1377,10 @@ class BoardData:
         'SCU': 9,   # Safety Control Unit
         'FCU': 10,  # Fuel Cell Unit
         'BMS': 11   # Battery Management System
-    }
+    })
 
     # Default CAN ID bases for each board type
-    BOARD_CAN_ID_BASES = {
+    BOARD_CAN_ID_BASES = MappingProxyType({
         'PCU': 0x300,   # Power Control Unit
         'TCU': 0x400,   # Transmission Control Unit
         'WLU': 0x500,   # Water Level Unit
@@ -606,7 +1393,7 @@ class BoardData:
         'SCU': 0x780,   # Safety Control Unit
         'FCU': 0x800,   # Fuel Cell Unit
         'BMS': 0x880    # Battery Management System
-    }
+    })
 
     def __init__(self, board_type: str):
         """
@@ -616,311 +1403,176 @@ class BoardData:
             board_type: Type of board (PCU, TCU, etc.)
         """
         self.board_type = board_type
-        self.table_addr = [0] * self.TABLE_ADDR_MAX
-        self.variable_names = []
-        self.can_id_base = 0x300  # Default CAN ID base
+        self.table_addr = bytes(self.TABLE_ADDR_MAX)
+        self.variable_names = ()
+        self.can_id_base = self.BOARD_CAN_ID_BASES.get(board_type, 0x300)
 
         # Initialize board-specific data
-        if board_type == 'PCU':
-            self._init_pcu_data()
-        elif board_type == 'TCU':
-            self._init_tcu_data()
-        elif board_type == 'BMS':
-            self._init_bms_data()
-        elif board_type == 'SCU':
-            self._init_scu_data()
-        elif board_type == 'FCU':
-            self._init_fcu_data()
-        elif board_type == 'WLU':
-            self._init_wlu_data()
-        elif board_type == 'OBD_DC_DC':
-            self._init_obd_dcdc_data()
-        elif board_type == 'CCU':
-            self._init_ccu_data()
-        elif board_type == 'GATE':
-            self._init_gate_data()
-        elif board_type == 'PDU':
-            self._init_pdu_data()
-        elif board_type == 'ZCU':
-            self._init_zcu_data()
-        elif board_type == 'VCU':
-            self._init_vcu_data()
+        init = self._BOARD_INIT.get(board_type)
+        if init is not None:
+            init(self)
+
+        self.lengths, self.read_requests = _variable_layout(self.table_addr)
+        self.preview_names = self.variable_names[:10]  # First 10 for display
 
     def _init_pcu_data(self):
         """Initialize PCU (Power Control Unit) data structure"""
-        self.table_addr = [
-            0, 2, 6, 10, 14, 18, 19, 20, 21, 22,
-            23, 27, 31, 35, 37, 39, 41, 43, 45, 47,
-            51, 52, 53, 54, 55, 56, 57, 58, 60, 62,
-            64, 66, 68, 70, 72, 74, 76, 77, 78, 79,
-            80, 81, 82, 83, 84, 85, 87, 91, 95, 99, 103
-        ]
-
-        self.variable_names = [
-            "Flash CRC16", "Flash counter", "Supervisor key", "Admin key", "User key",
-            "Manuf. rev.", "Model", "Type", "Software rev.", "Hardware rev.",
-            "Date manuf.", "Date service", "Date current", "Log number", "Log index",
-            "Event number", "Event index", "Failure number", "Failure index", "Com ID",
-            "Com index", "Com type", "Setup", "Option", "Verbose",
-            "Debug", "Param", "Top speed FW", "Top speed RV", "Min speed FW",
-            "Min speed RV", "Dock speed FW", "Dock speed RV", "Max torque FW", "Max torque RV",
-            "Mtn max torque", "Eco/Sport ratio", "Filter RPM step", "Filter rpm step", "Filter TRQ step",
-            "Filter trq step", "Reverse dir.", "Forward dir.", "Motor low temp", "Motor cool LPM",
-            "F/R speed max", "Ramp FW acc.", "Ramp RV acc.", "Ramp FW dec.", "Ramp RV dec.", "Batt low temp"
-        ]
+        self.table_addr = _TABLE_ADDR_PCU_BMS
+
+        self.variable_names = _COMMON_VARIABLE_NAMES + (
+            "Setup", "Option", "Verbose", "Debug", "Param",
+            "Top speed FW", "Top speed RV", "Min speed FW", "Min speed RV", "Dock speed FW",
+            "Dock speed RV", "Max torque FW", "Max torque RV", "Mtn max torque", "Eco/Sport ratio",
+            "Filter RPM step", "Filter rpm step", "Filter TRQ step", "Filter trq step", "Reverse dir.",
+            "Forward dir.", "Motor low temp", "Motor cool LPM", "F/R speed max", "Ramp FW acc.",
+            "Ramp RV acc.", "Ramp FW dec.", "Ramp RV dec.", "Batt low temp"
+        )
 
     def _init_tcu_data(self):
         """Initialize TCU (Transmission Control Unit) data structure"""
-        self.table_addr = [
-            0, 2, 6, 10, 14, 18, 19, 20, 21, 22,
-            23, 27, 31, 35, 37, 39, 41, 43, 45, 47,
-            51, 52, 53, 54, 55, 56, 57, 58, 60, 62,
-            64, 66, 68, 70, 71, 73, 74, 76, 78, 80,
-            82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92
-        ]
-
-        self.variable_names = [
-            "Flash CRC16", "Flash counter", "Supervisor key", "Admin key", "User key",
-            "Manuf. rev.", "Model", "Type", "Software rev.", "Hardware rev.",
-            "Date manuf.", "Date service", "Date current", "Log number", "Log index",
-            "Event number", "Event index", "Failure number", "Failure index", "Com ID",
-            "Com index", "Com type", "Mode init", "Mode option", "Mode verbose",
-            "Mode debug", "Mode param", "Ana1 value min", "Ana1 value max", "Ana2 value min",
-            "Ana2 value max", "Ana3 value min", "Ana3 value max", "Brake trigger", "Openwire limit",
-            "POT3 volt. gap", "POT3 R value", "POT3 N value", "POT3 D value", "POT3 P value",
-            "LOG dot 1", "LOG dot 2", "LOG dot 3", "LOG dot 4", "LOG dot 5",
-            "LOG dot 6", "Reserved", "Reserved", "Reserved", "Reserved"
-        ]
+        self.table_addr = _COMMON_TABLE_ADDR + bytes((
+            53, 54, 55, 56, 57, 58, 60, 62, 64, 66,
+            68, 70, 71, 73, 74, 76, 78, 80, 82, 83,
+            84, 85, 86, 87, 88, 89, 90, 91, 92
+        ))
+
+        self.variable_names = _COMMON_VARIABLE_NAMES + _MODE_VARIABLE_NAMES + (
+            "Ana1 value min", "Ana1 value max", "Ana2 value min", "Ana2 value max", "Ana3 value min",
+            "Ana3 value max", "Brake trigger", "Openwire limit", "POT3 volt. gap", "POT3 R value",
+            "POT3 N value", "POT3 D value", "POT3 P value", "LOG dot 1", "LOG dot 2",
+            "LOG dot 3", "LOG dot 4", "LOG dot 5", "LOG dot 6"
+        ) + ("Reserved",) * 4
 
     def _init_bms_data(self):
         """Initialize BMS (Battery Management System) data structure"""
-        self.table_addr = [
-            0, 2, 6, 10, 14, 18, 19, 20, 21, 22,
-            23, 27, 31, 35, 37, 39, 41, 43, 45, 47,
-            51, 52, 53, 54, 55, 56, 57, 58, 60, 62,
-            64, 66, 68, 70, 72, 74, 76, 77, 78, 79,
-            80, 81, 82, 83, 84, 85, 87, 91, 95, 99, 103
-        ]
-
-        self.variable_names = [
-            "Flash CRC16", "Flash counter", "Supervisor key", "Admin key", "User key",
-            "Manuf. rev.", "Model", "Type", "Software rev.", "Hardware rev.",
-            "Date manuf.", "Date service", "Date current", "Log number", "Log index",
-            "Event number", "Event index", "Failure number", "Failure index", "Com ID",
-            "Com index", "Com type", "Mode init", "Mode option", "Mode verbose",
-            "Mode debug", "Mode param", "Abs. max speed F", "Abs. max speed R", "Lim. max speed F",
-            "Lim. max speed R", "Mtn. max speed F", "Mtn. max pseed R", "Max torque FW", "Max torque RV",
-            "Mtn max torque", "Eco/Sport ratio", "Filter RPM step", "Filter rpm step", "Filter TRQ step",
-            "Filter trq step", "Reverse dir.", "Forward dir.", "Speed mode val.", "Torq mode val.",
-            "F/R speed max", "HVBATT addr", "DISCHG filter", "CHG filter", "VCU addr"
-        ]
+        self.table_addr = _TABLE_ADDR_PCU_BMS
+
+        self.variable_names = _COMMON_VARIABLE_NAMES + _MODE_VARIABLE_NAMES + (
+            "Abs. max speed F", "Abs. max speed R", "Lim. max speed F", "Lim. max speed R", "Mtn. max speed F",
+            "Mtn. max pseed R", "Max torque FW", "Max torque RV", "Mtn max torque", "Eco/Sport ratio",
+            "Filter RPM step", "Filter rpm step", "Filter TRQ step", "Filter trq step", "Reverse dir.",
+            "Forward dir.", "Speed mode val.", "Torq mode val.", "F/R speed max", "HVBATT addr",
+            "DISCHG filter", "CHG filter", "VCU addr"
+        )
 
     def _init_scu_data(self):
         """Initialize SCU (Safety Control Unit) data structure"""
-        self.table_addr = [
-            0, 2, 6, 10, 14, 18, 19, 20, 21, 22,
-            23, 27, 31, 35, 37, 39, 41, 43, 45, 47,
-            51, 52, 53, 54, 55, 56, 57, 58, 59, 60,
-            61, 62, 63, 64, 65, 66, 67, 68, 69, 70,
-            71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81
-        ]
-
-        self.variable_names = [
-            "Flash CRC16", "Flash counter", "Supervisor key", "Admin key", "User key",
-            "Manuf. rev.", "Model", "Type", "Software rev.", "Hardware rev.",
-            "Date manuf.", "Date service", "Date current", "Log number", "Log index",
-            "Event number", "Event index", "Failure number", "Failure index", "Com ID",
-            "Com index", "Com type", "Mode init", "Mode option", "Mode verbose",
-            "Mode debug", "Mode param", "Temp max", "Temp min", "Frame rate",
-            "Reserved", "Reserved", "Reserved", "Reserved", "Reserved",
-            "Reserved", "Reserved", "Reserved", "Reserved", "Reserved",
-            "Reserved", "Reserved", "Reserved", "Reserved", "Reserved",
-            "Reserved", "Reserved", "Reserved", "Reserved", "Reserved"
-        ]
+        self.table_addr = _TABLE_ADDR_CONTIGUOUS
+
+        self.variable_names = _COMMON_VARIABLE_NAMES + _MODE_VARIABLE_NAMES + (
+            "Temp max", "Temp min", "Frame rate"
+        ) + ("Reserved",) * 20
 
     def _init_fcu_data(self):
         """Initialize FCU (Fuel Cell Unit) data structure"""
-        self.table_addr = [
-            0, 2, 6, 10, 14, 18, 19, 20, 21, 22,
-            23, 27, 31, 35, 37, 39, 41, 43, 45, 47,
-            51, 52, 53, 54, 55, 56, 57, 58, 59, 60,
-            61, 62, 63, 64, 65, 66, 67, 68, 69, 70,
-            71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81
-        ]
-
-        self.variable_names = [
-            "Flash CRC16", "Flash counter", "Supervisor key", "Admin key", "User key",
-            "Manuf. rev.", "Model", "Type", "Software rev.", "Hardware rev.",
-            "Date manuf.", "Date service", "Date current", "Log number", "Log index",
-            "Event number", "Event index", "Failure number", "Failure index", "Com ID",
-            "Com index", "Com type", "Mode init", "Mode option", "Mode verbose",
-            "Mode debug", "Mode param", "Flow max", "Flow min", "Frame rate",
-            "Reserved", "Reserved", "Reserved", "Reserved", "Reserved",
-            "Reserved", "Reserved", "Reserved", "Reserved", "Reserved",
-            "Reserved", "Reserved", "Reserved", "Reserved", "Reserved",
-            "Reserved", "Reserved", "Reserved", "Reserved", "Reserved"
-        ]
+        self.table_addr = _TABLE_ADDR_CONTIGUOUS
+
+        self.variable_names = _COMMON_VARIABLE_NAMES + _MODE_VARIABLE_NAMES + (
+            "Flow max", "Flow min", "Frame rate"
+        ) + ("Reserved",) * 20
 
     def _init_wlu_data(self):
         """Initialize WLU (Water Level Unit) data structure"""
-        self.table_addr = [
-            0, 2, 6, 10, 14, 18, 19, 20, 21, 22,
-            23, 27, 31, 35, 37, 39, 41, 43, 45, 47,
-            51, 52, 53, 54, 55, 56, 57, 58, 59, 60,
-            61, 62, 66, 70, 72, 74, 76, 77, 78, 79,
-            80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90
-        ]
-
-        self.variable_names = [
-            "Flash CRC16", "Flash counter", "Supervisor key", "Admin key", "User key",
-            "Manuf. rev.", "Model", "Type", "Software rev.", "Hardware rev.",
-            "Date manuf.", "Date service", "Date current", "Log number", "Log index",
-            "Event number", "Event index", "Failure number", "Failure index", "Com ID",
-            "Com index", "Com type", "Mode init", "Mode option", "Mode verbose",
-            "Mode debug", "Mode param", "Temp max", "Current coeff", "Voltage min",
-            "Current max", "Warning CANID", "Warning filter", "Warning value", "Warning ON time",
-            "Warning OFF time", "Reserved", "Reserved", "Reserved", "Reserved",
-            "Reserved", "Reserved", "Reserved", "Reserved", "Reserved",
-            "Reserved", "Reserved", "Reserved", "Reserved", "Reserved"
-        ]
+        self.table_addr = _COMMON_TABLE_ADDR + bytes((
+            53, 54, 55, 56, 57, 58, 59, 60, 61, 62,
+            66, 70, 72, 74, 76, 77, 78, 79, 80, 81,
+            82, 83, 84, 85, 86, 87, 88, 89, 90
+        ))
+
+        self.variable_names = _COMMON_VARIABLE_NAMES + _MODE_VARIABLE_NAMES + (
+            "Temp max", "Current coeff", "Voltage min", "Current max", "Warning CANID",
+            "Warning filter", "Warning value", "Warning ON time", "Warning OFF time"
+        ) + ("Reserved",) * 14
 
     def _init_obd_dcdc_data(self):
         """Initialize OBD DC-DC data structure"""
-        self.table_addr = [
-            0, 2, 6, 10, 14, 18, 19, 20, 21, 22,
-            23, 27, 31, 35, 37, 39, 41, 43, 45, 47,
-            51, 52, 53, 54, 55, 56, 57, 58, 60, 62,
-            66, 70, 74, 75, 76, 77, 78, 79, 80, 81,
-            82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92
-        ]
-
-        self.variable_names = [
-            "Flash CRC16", "Flash counter", "Supervisor key", "Admin key", "User key",
-            "Manuf. rev.", "Model", "Type", "Software rev.", "Hardware rev.",
-            "Date manuf.", "Date service", "Date current", "Log number", "Log index",
-            "Event number", "Event index", "Failure number", "Failure index", "Com ID",
-            "Com index", "Com type", "Mode init", "Mode option", "Mode verbose",
-            "Mode debug", "Mode param", "DCDC voltage", "DCDC current", "HVBATT CAN id",
-            "Discharge filter", "Charge filter", "Reserved", "Reserved", "Reserved",
-            "Reserved", "Reserved", "Reserved", "Reserved", "Reserved",
-            "Reserved", "Reserved", "Reserved", "Reserved", "Reserved",
-            "Reserved", "Reserved", "Reserved", "Reserved", "Reserved"
-        ]
+        self.table_addr = _COMMON_TABLE_ADDR + bytes((
+            53, 54, 55, 56, 57, 58, 60, 62, 66, 70,
+            74, 75, 76, 77, 78, 79, 80, 81, 82, 83,
+            84, 85, 86, 87, 88, 89, 90, 91, 92
+        ))
+
+        self.variable_names = _COMMON_VARIABLE_NAMES + _MODE_VARIABLE_NAMES + (
+            "DCDC voltage", "DCDC current", "HVBATT CAN id", "Discharge filter", "Charge filter"
+        ) + ("Reserved",) * 18
 
     def _init_ccu_data(self):
         """Initialize CCU (Central Control Unit) data structure"""
-        self.table_addr = [
-            0, 2, 6, 10, 14, 18, 19, 20, 21, 22,
-            23, 27, 31, 35, 37, 39, 41, 43, 45, 47,
-            51, 52, 53, 54, 55, 56, 57, 58, 59, 60,
-            61, 62, 63, 64, 65, 66, 67, 68, 69, 70,
-            71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81
-        ]
-
-        self.variable_names = [
-            "Flash CRC16", "Flash counter", "Supervisor key", "Admin key", "User key",
-            "Manuf. rev.", "Model", "Type", "Software rev.", "Hardware rev.",
-            "Date manuf.", "Date service", "Date current", "Log number", "Log index",
-            "Event number", "Event index", "Failure number", "Failure index", "Com ID",
-            "Com index", "Com type", "Mode init", "Mode option", "Mode verbose",
-            "Mode debug", "Mode param", "Flow setpoint", "ZCU curr", "Service pump %",
-            "ZCU rated curr", "ZCU timeout", "Reserved", "Reserved", "Reserved",
-            "Reserved", "Reserved", "Reserved", "Reserved", "Reserved",
-            "Reserved", "Reserved", "Reserved", "Reserved", "Reserved",
-            "Reserved", "Reserved", "Reserved", "Reserved", "Reserved"
-        ]
+        self.table_addr = _TABLE_ADDR_CONTIGUOUS
+
+        self.variable_names = _COMMON_VARIABLE_NAMES + _MODE_VARIABLE_NAMES + (
+            "Flow setpoint", "ZCU curr", "Service pump %", "ZCU rated curr", "ZCU timeout"
+        ) + ("Reserved",) * 18
 
     def _init_gate_data(self):
         """Initialize GATE (Gateway) data structure"""
-        self.table_addr = [
-            0, 2, 6, 10, 14, 18, 19, 20, 21, 22,
-            23, 27, 31, 35, 37, 39, 41, 43, 45, 47,
-            51, 52, 53, 54, 55, 56, 57, 58, 62, 66,
-            70, 74, 78, 82, 86, 90, 94, 98, 102, 106,
-            110, 114, 118, 122, 123, 124, 125, 126, 127, 128, 129
-        ]
-
-        self.variable_names = [
-            "Flash CRC16", "Flash counter", "Supervisor key", "Admin key", "User key",
-            "Manuf. rev.", "Model", "Type", "Software rev.", "Hardware rev.",
-            "Date manuf.", "Date service", "Date current", "Log number", "Log index",
-            "Event number", "Event index", "Failure number", "Failure index", "Com ID",
-            "Com index", "Com type", "Mode init", "Mode option", "Mode verbose",
-            "Mode debug", "Mode param", "CAN2 src (ADDR1)", "CAN1 dst (ADDR1)", "CAN1 src (ADDR1)",
-            "CAN2 dst (ADDR1)", "CAN2 src (ADDR2)", "CAN1 dst (ADDR2)", "CAN1 src (ADDR2)", "CAN2 dst (ADDR2)",
-            "CAN2 src (ADDR3)", "CAN1 dst (ADDR3)", "CAN1 src (ADDR3)", "CAN2 dst (ADDR3)", "CAN2 src (ADDR4)",
-            "CAN1 dst (ADDR4)", "CAN1 src (ADDR4)", "CAN2 dst (ADDR4)", "Reserved", "Reserved",
-            "Reserved", "Reserved", "Reserved", "Reserved", "Reserved"
-        ]
+        self.table_addr = _COMMON_TABLE_ADDR + bytes((
+            53, 54, 55, 56, 57, 58, 62, 66, 70, 74,
+            78, 82, 86, 90, 94, 98, 102, 106, 110, 114,
+            118, 122, 123, 124, 125, 126, 127, 128, 129
+        ))
+
+        self.variable_names = _COMMON_VARIABLE_NAMES + _MODE_VARIABLE_NAMES + (
+            "CAN2 src (ADDR1)", "CAN1 dst (ADDR1)", "CAN1 src (ADDR1)", "CAN2 dst (ADDR1)", "CAN2 src (ADDR2)",
+            "CAN1 dst (ADDR2)", "CAN1 src (ADDR2)", "CAN2 dst (ADDR2)", "CAN2 src (ADDR3)", "CAN1 dst (ADDR3)",
+            "CAN1 src (ADDR3)", "CAN2 dst (ADDR3)", "CAN2 src (ADDR4)", "CAN1 dst (ADDR4)", "CAN1 src (ADDR4)",
+            "CAN2 dst (ADDR4)"
+        ) + ("Reserved",) * 7
 
     def _init_pdu_data(self):
         """Initialize PDU (Power Distribution Unit) data structure"""
-        self.table_addr = [
-            0, 2, 6, 10, 14, 18, 19, 20, 21, 22,
-            23, 27, 31, 35, 37, 39, 41, 43, 45, 47,
-            51, 52, 53, 54, 55, 56, 57, 58, 59, 60,
-            61, 62, 63, 64, 65, 66, 67, 68, 69, 70,
-            71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81
-        ]
-
-        self.variable_names = [
-            "Flash CRC16", "Flash counter", "Supervisor key", "Admin key", "User key",
-            "Manuf. rev.", "Model", "Type", "Software rev.", "Hardware rev.",
-            "Date manuf.", "Date service", "Date current", "Log number", "Log index",
-            "Event number", "Event index", "Failure number", "Failure index", "Com ID",
-            "Com index", "Com type", "Mode init", "Mode option", "Mode verbose",
-            "Mode debug", "Mode param", "Motor2 enable", "Generator enable", "Precharge2 enable",
-            "Leakage enable", "Batt delay", "Precharge1 delay", "Precharge2 delay", "Generator delay",
-            "Reserved", "Reserved", "Reserved", "Reserved", "Reserved",
-            "Reserved", "Reserved", "Reserved", "Reserved", "Reserved",
-            "Reserved", "Reserved", "Reserved", "Reserved", "Reserved"
-        ]
+        self.table_addr = _TABLE_ADDR_CONTIGUOUS
+
+        self.variable_names = _COMMON_VARIABLE_NAMES + _MODE_VARIABLE_NAMES + (
+            "Motor2 enable", "Generator enable", "Precharge2 enable", "Leakage enable", "Batt delay",
+            "Precharge1 delay", "Precharge2 delay", "Generator delay"
+        ) + ("Reserved",) * 15
 
     def _init_zcu_data(self):
         """Initialize ZCU (Zone Control Unit) data structure"""
-        self.table_addr = [
-            0, 2, 6, 10, 14, 18, 19, 20, 21, 22,
-            23, 27, 31, 35, 37, 39, 41, 43, 45, 47,
-            51, 52, 53, 54, 55, 56, 57, 58, 59, 60,
-            62, 63, 65, 66, 67, 68, 70, 72, 74, 75,
-            76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86
-        ]
-
-        self.variable_names = [
-            "Flash CRC16", "Flash counter", "Supervisor key", "Admin key", "User key",
-            "Manuf. rev.", "Model", "Type", "Software rev.", "Hardware rev.",
-            "Date manuf.", "Date service", "Date current", "Log number", "Log index",
-            "Event number", "Event index", "Failure number", "Failure index", "Com ID",
-            "Com index", "Com type", "Setup", "Option", "Verbose",
-            "Debug", "Param", "Nom peak current", "Max peak current", "Peak timeout",
-            "Max cont current", "Cont timeout", "Max MOS temp", "Min MOS temp", "Pump type",
-            "Throttle max", "Tick to Min%", "Tick to Max%", "Min PWM to flow", "Derating PWM %",
-            "Derating temp diff", "Derating delay", "Min flow derating", "CAN timeout", "Reserved",
-            "Reserved", "Reserved", "Reserved", "Reserved", "Reserved"
-        ]
+        self.table_addr = _COMMON_TABLE_ADDR + bytes((
+            53, 54, 55, 56, 57, 58, 59, 60, 62, 63,
+            65, 66, 67, 68, 70, 72, 74, 75, 76, 77,
+            78, 79, 80, 81, 82, 83, 84, 85, 86
+        ))
+
+        self.variable_names = _COMMON_VARIABLE_NAMES + (
+            "Setup", "Option", "Verbose", "Debug", "Param",
+            "Nom peak current", "Max peak current", "Peak timeout", "Max cont current", "Cont timeout",
+            "Max MOS temp", "Min MOS temp", "Pump type", "Throttle max", "Tick to Min%",
+            "Tick to Max%", "Min PWM to flow", "Derating PWM %", "Derating temp diff", "Derating delay",
+            "Min flow derating", "CAN timeout"
+        ) + ("Reserved",) * 6
 
     def _init_vcu_data(self):
         """Initialize VCU (Vehicle Control Unit) data structure"""
-        self.table_addr = [
-            0, 2, 6, 10, 14, 18, 19, 20, 21, 22,
-            23, 27, 31, 35, 37, 39, 41, 43, 45, 47,
-            51, 52, 53, 54, 55, 56, 57, 58, 59, 60,
-            61, 63, 65, 67, 69, 71, 73, 74, 75, 76,
-            77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87
-        ]
-
-        self.variable_names = [
-            "Flash CRC16", "Flash counter", "Supervisor key", "Admin key", "User key",
-            "Manuf. rev.", "Model", "Type", "Software rev.", "Hardware rev.",
-            "Date manuf.", "Date service", "Date current", "Log number", "Log index",
-            "Event number", "Event index", "Failure number", "Failure index", "Com ID",
-            "Com index", "Com type", "Setup", "Option", "Verbose",
-            "Debug", "Param", "BAT low temp", "CHG high temp", "Free",
-            "PDU config", "End of charge", "HV Bat max", "HV pack energy", "SHD threshold",
-            "IGNoff timeout", "DCDC Setpoint", "Reserved", "Reserved", "Reserved",
-            "Reserved", "Reserved", "Reserved", "Reserved", "Reserved", "Reserved",
-            "Reserved", "Reserved", "Reserved", "Reserved", "Reserved"
-        ]
+        self.table_addr = _COMMON_TABLE_ADDR + bytes((
+            53, 54, 55, 56, 57, 58, 59, 60, 61, 63,
+            65, 67, 69, 71, 73, 74, 75, 76, 77, 78,
+            79, 80, 81, 82, 83, 84, 85, 86, 87
+        ))
+
+        self.variable_names = _COMMON_VARIABLE_NAMES + (
+            "Setup", "Option", "Verbose", "Debug", "Param",
+            "BAT low temp", "CHG high temp", "Free", "PDU config", "End of charge",
+            "HV Bat max", "HV pack energy", "SHD threshold", "IGNoff timeout", "DCDC Setpoint"
+        ) + ("Reserved",) * 14
+
+    # Board type -> initializer, resolved once instead of an if/elif cascade
+    _BOARD_INIT = {
+        'PCU': _init_pcu_data,
+        'TCU': _init_tcu_data,
+        'BMS': _init_bms_data,
+        'SCU': _init_scu_data,
+        'FCU': _init_fcu_data,
+        'WLU': _init_wlu_data,
+        'OBD_DC_DC': _init_obd_dcdc_data,
+        'CCU': _init_ccu_data,
+        'GATE': _init_gate_data,
+        'PDU': _init_pdu_data,
+        'ZCU': _init_zcu_data,
+        'VCU': _init_vcu_data,
+    }
 
     def get_variable_address(self, index: int) -> int:
         """
@@ -932,10 +1584,31 @@ class BoardData:
         Returns:
             int: Memory address
         """
-        if 0 <= index < len(self.table_addr):
-            return self.table_addr[index]
+        # Negative indices would wrap around, everything else is EAFP
+        if index >= 0:
+            try:
+                return self.table_addr[index]
+            except IndexError:
+                pass
         return 0
 
+    def get_variable_length(self, index: int) -> int:
+        """
+        Get the size in bytes of a variable
+
+        Args:
+            index: Variable index
+
+        Returns:
+            int: Variable length (1-4)
+        """
+        if index >= 0:
+            try:
+                return self.lengths[index]
+            except IndexError:
+                pass
+        return 4
+
     def get_default_can_id_base(self) -> int:
         """
         Get the default CAN ID base for this board type
@@ -943,7 +1616,7 @@ class BoardData:
         Returns:
             int: Default CAN ID base
         """
-        return self.BOARD_CAN_ID_BASES.get(self.board_type, 0x300)
+        return self.can_id_base
 
     def get_variable_name(self, index: int) -> str:
         """
@@ -955,8 +1628,11 @@ class BoardData:
         Returns:
             str: Variable name
         """
-        if 0 <= index < len(self.variable_names):
-            return self.variable_names[index]
+        if index >= 0:
+            try:
+                return self.variable_names[index]
+            except IndexError:
+                pass
         return f"Unknown_Var_{index}"
 
 
@@ -965,18 +1641,29 @@ class RetainVarMonitor:
     Main class for RetainVar Monitor functionality
     """
 
-    def __init__(self, can_channel: str = 'PCAN_USBBUS1', baudrate: BaudRate = BaudRate.BAUD_250K):
+    # Read requests in flight at once in read_variables
+    READ_BURST = 16
+
+    def __init__(self, can_channel: str = 'PCAN_USBBUS1', baudrate: BaudRate = BaudRate.BAUD_250K,
+                 filter_boards: Optional[Tuple[int, ...]] = None):
         """
         Initialize RetainVar Monitor
 
         Args:
             can_channel: CAN interface channel
             baudrate: CAN baud rate
+            filter_boards: Board indices whose read responses are the only
+                frames the driver passes up once a board is selected
+                (None = receive all traffic)
         """
         self.can_comm = CANCommunication(can_channel, baudrate)
         self.bootloader = BootloaderProtocol(self.can_comm)
         self.current_board = None
         self.authenticated = False  # Track authentication status
+        self.filter_boards = filter_boards
+
+        # Reader specialized to the selected board, bound by select_board
+        self.read_board_variable = None
 
     def connect(self) -> CANResult:
         """
@@ -1009,12 +1696,70 @@ class RetainVarMonitor:
         try:
             self.current_board = BoardData(board_type)
             self.authenticated = False  # Reset authentication when changing boards
+            if self.filter_boards is not None:
+                # Response CAN ID: canid + 0x0A + (board_index << 4)
+                base = self.current_board.can_id_base
+                self.can_comm.set_response_filter(
+                    [base + 0x0A + (board_index << 4) for board_index in self.filter_boards])
+            self.read_board_variable = self._specialize_reader(self.current_board)
             logger.info(f"Selected board type: {board_type}")
             return True
         except Exception as e:
             logger.error(f"Error selecting board {board_type}: {e}")
             return False
 
+    def _specialize_reader(self, board: BoardData) -> Callable[..., Tuple[bool, int]]:
+        """
+        Build a read function with one board's tables and CAN IDs bound in
+
+        The returned read_board_variable(var_index, board_index=0) behaves like
+        read_variable with the board's default CAN ID base, but keeps every
+        table, ID and bound method in closure cells instead of resolving them
+        through attributes on each call. Unknown indices go through
+        read_variable.
+
+        Args:
+            board: Board whose layout to bind
+
+        Returns:
+            The specialized read function
+        """
+        read_requests = board.read_requests
+        request_id = board.can_id_base + 0x05
+        response_id = board.can_id_base + 0x0A
+        message = can.Message
+        send_frame = self.can_comm.send_frame
+        expect_response = self.can_comm.expect_response
+        release_response = self.can_comm.release_response
+        decode = self._decode_read_response
+        await_reply = self._await_read_reply
+        ok = CANResult.ERR_OK
+        read_variable = self.read_variable
+
+        def read_board_variable(var_index: int, board_index: int = 0) -> Tuple[bool, int]:
+            if var_index < 0 or var_index >= len(read_requests):
+                return read_variable(var_index, None, board_index)
+
+            offset = board_index << 4
+            request = read_requests[var_index]
+            # One frame per call, so reads from several threads cannot
+            # overwrite each other's request
+            tx_msg = message(arbitration_id=request_id + offset, data=request, is_extended_id=False)
+
+            waiter = expect_response(response_id + offset)
+            try:
+                if send_frame(tx_msg) is not ok:
+                    return False, 0
+                response = await_reply(waiter, request)
+            finally:
+                release_response(waiter)
+
+            if response is None:
+                return False, 0
+            return True, decode(response.data)[0]
+
+        return read_board_variable
+
     def read_variable(self, var_index: int, can_id_base: int = None, board_index: int = 0) -> Tuple[bool, int]:
         """
         Read a retain variable from the board using the correct protocol
@@ -1033,77 +1778,230 @@ class RetainVarMonitor:
 
         # Use board default if not explicitly provided
         if can_id_base is None:
-            can_id_base = self.current_board.get_default_can_id_base()
+            can_id_base = self.current_board.can_id_base
 
         try:
-            # Get the memory address for this variable
-            address = self.current_board.get_variable_address(var_index)
+            return self._read_variable(var_index, can_id_base, board_index)
+        except Exception as e:
+            logger.error(f"Error reading variable {var_index}: {e}")
+            return False, 0
 
-            # Calculate CAN ID for read request: canid + 0x05 + (board_index << 4)
-            read_can_id = can_id_base + 0x05 + (board_index << 4)
+    def _read_variable(self, var_index: int, can_id_base: int, board_index: int) -> Tuple[bool, int]:
+        """
+        Fast path of read_variable, without defaults or exception handling
 
-            # Calculate length (next address - current address, max 4)
-            if var_index + 1 < len(self.current_board.table_addr):
-                length = min(4, self.current_board.table_addr[var_index + 1] - address)
-            else:
-                length = 4  # Default for last variable
+        Args:
+            var_index: Variable index to read
+            can_id_base: CAN ID base for the board
+            board_index: Board index (0 for first board)
 
-            # Send read request
-            message = CANMessage(
-                id=read_can_id,
-                data=[
-                    0x10 + length,  # Command byte for read request
-                    address & 0xFF,
-                    (address >> 8) & 0xFF,
-                    (address >> 16) & 0xFF,
-                    0x00, 0x00, 0x00, 0x00
-                ]
-            )
+        Returns:
+            Tuple of (success, value)
+        """
+        # Calculate CAN ID for read request: canid + 0x05 + (board_index << 4)
+        request = self._read_request_data(var_index)
+        message = can.Message(arbitration_id=can_id_base + 0x05 + (board_index << 4),
+                              data=request, is_extended_id=False)
 
-            result = self.can_comm.send_message(message)
+        # Calculate response CAN ID: canid + 0x0A + (board_index << 4)
+        expected_response_id = can_id_base + 0x0A + (board_index << 4)
+
+        # Listen for the response before sending so it cannot be missed
+        waiter = self.can_comm.expect_response(expected_response_id)
+        try:
+            # Send read request
+            result = self.can_comm.send_frame(message)
             if result != CANResult.ERR_OK:
-                logger.debug(f"Failed to send read request for variable {var_index}: {result}")
+                logger.debug("Failed to send read request for variable %d: %s", var_index, result)
                 return False, 0
 
             # Wait for response
-            time.sleep(0.01)
-            result, response, _ = self.can_comm.receive_message(0.1)
-
-            if result == CANResult.ERR_OK and response:
-                # Calculate response CAN ID: canid + 0x0A + (board_index << 4)
-                expected_response_id = can_id_base + 0x0A + (board_index << 4)
-
-                if response.id == expected_response_id:
-                    # Extract value from response data (bytes 4-7, 32-bit little endian)
-                    value = (response.data[4] |
-                           (response.data[5] << 8) |
-                           (response.data[6] << 16) |
-                           (response.data[7] << 24))
-
-                    # Handle different data types based on response byte 0
-                    data_type = response.data[0] & 0x07
-                    if data_type == 0x01:  # 8-bit signed
-                        if value > 127:
-                            value -= 256
-                    elif data_type == 0x02:  # 16-bit signed
-                        if value > 32767:
-                            value -= 65536
-                    elif data_type == 0x04:  # 32-bit signed
-                        if value > 2147483647:
-                            value -= 4294967296
-
-                    logger.debug(f"Successfully read variable {var_index}: {value} (type: {data_type})")
-                    return True, value
-                else:
-                    logger.debug(f"Received response on wrong CAN ID: {response.id}, expected: {expected_response_id}")
-                    return False, 0
-            else:
-                logger.debug(f"No response received for variable {var_index} read request")
-                return False, 0
+            response = self._await_read_reply(waiter, request)
+        finally:
+            self.can_comm.release_response(waiter)
+
+        if response is not None:
+            value, data_type = self._decode_read_response(response.data)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Successfully read variable %d: %d (type: %d)", var_index, value, data_type)
+            return True, value
+        else:
+            logger.debug("No response received for variable %d read request", var_index)
+            return False, 0
+
+    @staticmethod
+    def _await_read_reply(waiter: ResponseWaiter, request: bytes,
+                          timeout: float = 0.1) -> Optional['can.Message']:
+        """
+        Wait for the reply to one read request
+
+        Replies share one CAN ID, so a concurrent read of the same board can
+        feed the waiter replies to other requests; those are skipped by the
+        address echoed in bytes 1-3.
+
+        Args:
+            waiter: Waiter registered for the response ID
+            request: Payload of the read request
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            The matching 8-byte response, or None on timeout
+        """
+        address = request[1:4]
+        deadline = time.monotonic() + timeout
+        while True:
+            response = waiter.get(deadline - time.monotonic())
+            if response is None:
+                return None
+            data = response.data
+            if len(data) == 8 and data[1:4] == address:
+                return response
+
+    def read_variables(self, indices: List[int], can_id_base: int = None, board_index: int = 0) -> Dict[int, int]:
+        """
+        Read several retain variables with pipelined requests
+
+        Up to READ_BURST requests are sent back-to-back before collecting the
+        replies. Replies share one CAN ID, so they are matched to requests by
+        the address echoed in bytes 1-3. All replies are decoded together once
+        the last burst is in. If a whole burst goes unanswered the board is
+        taken to be absent and the remaining bursts are skipped, so a silent
+        bus costs one reply timeout instead of one per burst.
 
+        Args:
+            indices: Variable indices to read
+            can_id_base: CAN ID base for the board (None = use board default)
+            board_index: Board index (0 for first board)
+
+        Returns:
+            Dict mapping variable index to value for every variable that answered
+        """
+        if not self.current_board:
+            logger.error("No board selected")
+            return {}
+
+        # Use board default if not explicitly provided
+        if can_id_base is None:
+            can_id_base = self.current_board.can_id_base
+
+        read_can_id = can_id_base + 0x05 + (board_index << 4)
+        expected_response_id = can_id_base + 0x0A + (board_index << 4)
+        answered = []
+        payloads = []
+
+        waiter = self.can_comm.expect_response(expected_response_id)
+        try:
+            for start in range(0, len(indices), self.READ_BURST):
+                pending = {}  # address -> variable index
+                messages = []
+                for var_index in indices[start:start + self.READ_BURST]:
+                    data = self._read_request_data(var_index)
+                    pending[data[1] | (data[2] << 8) | (data[3] << 16)] = var_index
+                    messages.append(CANMessage(id=read_can_id, data=data))
+
+                result = self.can_comm.send_messages(messages)
+                if result != CANResult.ERR_OK:
+                    logger.debug("Failed to send read burst: %s", result)
+                    break
+
+                burst_size = len(pending)
+                while pending:
+                    response = waiter.get(0.1)
+                    if response is None:
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("No response received for variables %s", sorted(pending.values()))
+                        break
+                    data = response.data
+                    if len(data) != 8:
+                        continue
+                    var_index = pending.pop(data[1] | (data[2] << 8) | (data[3] << 16), None)
+                    if var_index is not None:
+                        answered.append(var_index)
+                        payloads.append(data)
+
+                if len(pending) == burst_size:
+                    logger.debug("Board did not answer, skipping remaining read bursts")
+                    break
         except Exception as e:
-            logger.error(f"Error reading variable {var_index}: {e}")
-            return False, 0
+            logger.error(f"Error reading variables: {e}")
+        finally:
+            self.can_comm.release_response(waiter)
+
+        return dict(zip(answered, self._decode_read_responses(payloads)))
+
+    def read_all_variables(self, can_id_base: int = None, board_index: int = 0) -> Dict[int, int]:
+        """
+        Read every retain variable of the selected board
+
+        Args:
+            can_id_base: CAN ID base for the board (None = use board default)
+            board_index: Board index (0 for first board)
+
+        Returns:
+            Dict mapping variable index to value for every variable that answered
+        """
+        if not self.current_board:
+            logger.error("No board selected")
+            return {}
+        return self.read_variables(range(len(self.current_board.variable_names)), can_id_base, board_index)
+
+    def _read_request_data(self, var_index: int) -> bytes:
+        """
+        Build the payload of a read request
+
+        Args:
+            var_index: Variable index to read
+
+        Returns:
+            bytes: 8-byte request payload
+        """
+        if var_index >= 0:
+            try:
+                return self.current_board.read_requests[var_index]
+            except IndexError:
+                pass
+
+        # Unknown variable: 4-byte read at address 0, as before
+        return _RETAIN_REQUEST.pack(_RETAIN_READ + 4, 0)
+
+    @staticmethod
+    def _decode_read_response(data) -> Tuple[int, int]:
+        """
+        Decode the value carried by a read response
+
+        Args:
+            data: Response payload
+
+        Returns:
+            Tuple of (value, data_type)
+        """
+        data_type = data[0] & 0x07
+        unpacker = _SIGNED_VALUE_STRUCTS.get(data_type, _UNSIGNED_VALUE_STRUCT)
+        return unpacker.unpack_from(data, 4)[0], data_type
+
+    @staticmethod
+    def _decode_read_responses(payloads: List[bytes]) -> List[int]:
+        """
+        Decode the values of a burst of 8-byte read responses at once
+
+        Gives the same values as _decode_read_response, but unpacks the whole
+        burst with one struct call and sign-extends without branching.
+
+        Args:
+            payloads: Response payloads
+
+        Returns:
+            List of values in payload order
+        """
+        if not payloads:
+            return []
+        words = struct.unpack(f'<{2 * len(payloads)}I', b''.join(payloads))
+        sign_bits = _VALUE_SIGN_BITS
+        values = []
+        for data, raw in zip(payloads, words[1::2]):
+            sign = sign_bits.get(data[0] & 0x07, 0)
+            values.append(((raw & ((sign << 1) - 1)) ^ sign) - sign)
+        return values
 
     def write_variable(self, var_index: int, value: int, can_id_base: int = None, board_index: int = 0) -> bool:
         """
@@ -1131,72 +2029,57 @@ class RetainVarMonitor:
 
         # Use board default if not explicitly provided
         if can_id_base is None:
-            can_id_base = self.current_board.get_default_can_id_base()
+            can_id_base = self.current_board.can_id_base
 
         try:
-            # Get the memory address for this variable
-            address = self.current_board.get_variable_address(var_index)
+            return self._write_variable(var_index, value, can_id_base, board_index)
+        except Exception as e:
+            logger.error(f"Error writing variable {var_index}: {e}")
+            return False
 
-            # Calculate CAN ID for write request: canid + 0x05 + (board_index << 4)
-            write_can_id = can_id_base + 0x05 + (board_index << 4)
+    def _write_variable(self, var_index: int, value: int, can_id_base: int, board_index: int) -> bool:
+        """
+        Fast path of write_variable, without checks or exception handling
 
-            # Calculate length (next address - current address, max 4)
-            if var_index + 1 < len(self.current_board.table_addr):
-                length = min(4, self.current_board.table_addr[var_index + 1] - address)
-            else:
-                length = 4  # Default for last variable
-
-            # Send write request
-            message = CANMessage(
-                id=write_can_id,
-                data=[
-                    0x20 + length,  # Command byte for write request
-                    address & 0xFF,
-                    (address >> 8) & 0xFF,
-                    (address >> 16) & 0xFF,
-                    value & 0xFF,
-                    (value >> 8) & 0xFF,
-                    (value >> 16) & 0xFF,
-                    (value >> 24) & 0xFF
-                ]
-            )
+        Args:
+            var_index: Variable index to write
+            value: Value to write
+            can_id_base: CAN ID base for the board
+            board_index: Board index (0 for first board)
 
-            result = self.can_comm.send_message(message)
-            if result != CANResult.ERR_OK:
-                logger.debug(f"Failed to send write request for variable {var_index}: {result}")
-                return False
+        Returns:
+            bool: Success status
+        """
+        # Get the memory address for this variable
+        address = self.current_board.get_variable_address(var_index)
 
-            # Update authentication status if supervisor key was written
-            if var_index == 2:  # Supervisor key
-                self.authenticated = (value != 0)
-                if self.authenticated:
-                    logger.info("Supervisor authentication enabled")
-                else:
-                    logger.info("Supervisor authentication disabled")
+        # Calculate CAN ID for write request: canid + 0x05 + (board_index << 4)
+        write_can_id = can_id_base + 0x05 + (board_index << 4)
 
-            logger.debug(f"Successfully sent write request for variable {var_index} = {value}")
-            return True
-            # Send write command with variable address and value
-            address = self.current_board.get_variable_address(var_index)
-
-            message = CANMessage(
-                id=can_id_base + 2,  # Write command ID
-                data=[
-                    address & 0xFF,
-                    (address >> 8) & 0xFF,
-                    value & 0xFF,
-                    (value >> 8) & 0xFF,
-                    0x00, 0x00, 0x00, 0x00
-                ]
-            )
+        length = self.current_board.get_variable_length(var_index)
 
-            result = self.can_comm.send_message(message)
-            return result == CANResult.ERR_OK
+        # Send write request: command byte, 24-bit address, 32-bit value
+        message = can.Message(arbitration_id=write_can_id, is_extended_id=False,
+                              data=_RETAIN_REQUEST.pack((_RETAIN_WRITE + length) | (address << 8),
+                                                        value & 0xFFFFFFFF))
 
-        except Exception as e:
-            logger.error(f"Error writing variable {var_index}: {e}")
+        result = self.can_comm.send_frame(message)
+        if result != CANResult.ERR_OK:
+            logger.debug("Failed to send write request for variable %d: %s", var_index, result)
             return False
 
+        # Update authentication status if supervisor key was written
+        if var_index == 2:  # Supervisor key
+            self.authenticated = (value != 0)
+            if self.authenticated:
+                logger.info("Supervisor authentication enabled")
+            else:
+                logger.info("Supervisor authentication disabled")
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Successfully sent write request for variable %d = %d", var_index, value)
+        return True
+
     def program_firmware(self, hex_file: str, can_id_base: int = 0x300) -> bool:
         """
         Program firmware to a board
@@ -1224,7 +2107,7 @@ class RetainVarMonitor:
             "board_type": self.current_board.board_type,
             "can_id_base": f"0x{self.current_board.can_id_base:03X}",
             "variables_count": len(self.current_board.variable_names),
-            "variable_names": self.variable_names[:10]  # First 10 for display
+            "variable_names": self.current_board.preview_names
         }
 
     def list_variables(self) -> List[Tuple[int, str]]:
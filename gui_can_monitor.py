@@ -10,6 +10,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
 import time
+import collections
+import bisect
 import sys
 import os
 
@@ -27,6 +29,64 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Unsigned mask and %-format spec by variable size in bytes; anything else
+# is shown as a 32-bit value
+_HEX_FORMATS = {
+    1: (0xFF, "0x%02X"),
+    2: (0xFFFF, "0x%04X"),
+}
+_HEX_FORMAT_DEFAULT = (0xFFFFFFFF, "0x%08X")
+
+
+# Message types bound once for the per-row comparisons
+_MT_EXTENDED = MessageType.MSGTYPE_EXTENDED
+_MT_RTR = MessageType.MSGTYPE_RTR
+
+
+def _parse_int(text):
+    """Parse an integer with an optional 0x/0o/0b prefix; raises ValueError if invalid"""
+    try:
+        return int(text, 0)
+    except ValueError:
+        # Base 0 rejects zero-padded decimals such as "010"
+        return int(text)
+
+
+def _fmt_data(data):
+    """Format CAN frame data bytes as space-separated hex"""
+    # bytes.hex with a separator formats the whole payload in one C call
+    return data.hex(' ').upper()
+
+
+def _fmt_age(age):
+    """Format the time since a CAN ID was last received for the Last Update column"""
+    if age < 1.0:
+        return "< 1s"
+    elif age < 60.0:
+        return f"{age:.1f}s"
+    return f"{age/60.0:.1f}m"
+
+
+def _fmt_id(message):
+    """Format the message type and ID columns for a CAN message"""
+    msgtype = message.msgtype
+    if msgtype == _MT_EXTENDED:
+        return "EXTENDED", f"{message.id:08X}h"
+    elif msgtype == _MT_RTR:
+        return "RTR", f"{message.id:03X}h"
+    return "STANDARD", f"{message.id:03X}h"
+
+
+class _VarState:
+    """Name, displayed value and treeview row of one retain variable"""
+    __slots__ = ('name', 'value', 'item_id')
+
+    def __init__(self, name, value, item_id):
+        self.name = name
+        self.value = value
+        self.item_id = item_id
+
+
 class CANSettingsWindow:
     """Settings window for CAN configuration"""
 
@@ -126,17 +186,38 @@ class CANMonitorWindow:
 
         # Initialize status variable early to prevent attribute errors
         self.status_var = tk.StringVar(value="Initializing...")
+        self.status_hold = 3.0  # s a transient status message stays up before the counters return
+        self._status_hold_until = 0.0  # Counters are not repainted before this time
 
         # Data
         self.message_count = 0
         self.received_messages = []
         self.monitoring_active = False
-        self.last_message_time = time.time()
-        self.can_id_map = {}  # Dictionary to track unique CAN IDs and their latest data
+        self.monitor_thread = None
+        self._rx_stop = threading.Event()  # Stops the monitor thread
+        self.last_message_time = time.monotonic()
+        self._last_status_paint = 0.0  # When the status bar was last updated for new messages
+        self.can_id_map = collections.OrderedDict()  # Unique CAN IDs and their latest data, least recently updated first
         self.max_unique_ids = 100  # Maximum number of unique IDs to track
-        self.variable_values = {}  # Dictionary to store current variable values
+        self.tree_items = {}  # CAN ID -> message_tree item id, updated in place
+        self._sorted_ids = []  # CAN IDs with a row, in display (ascending) order
+        self._stale_ids = set()  # CAN IDs updated while the CAN Bus tab was hidden
+        self._rx_queue = collections.deque(maxlen=10000)  # Frames from the monitor thread
+        self.rx_dropped = 0  # Frames dropped because the GUI fell behind a full queue
+        self.rx_drain_interval = 50  # ms between GUI batches of received frames
+        self.rx_drain_idle_max = 200  # ms between batches after the bus goes quiet
+        self._drain_delay = self.rx_drain_interval  # Current (adaptive) batch interval
+        self.rx_drain_batch = 500    # Maximum frames processed per batch
+        self.rx_age_interval = 1000  # ms between Last Update column refreshes
+        self.variable_values = {}  # Variable index -> _VarState
+        self._var_sizes = {}  # Variable index -> size in bytes for the selected board
+        self._dirty_vars = set()  # Variable indices whose row needs repainting
+        self._var_flush_pending = False  # Row repaint scheduled for the next idle
+        self._target_cache = None  # (board, (can_id_base, board_index)) parsed from the UI
+        self._var_fmt = {}  # Variable index -> (mask, format spec) for the selected board
         self.variable_read_timer = None  # Timer for automatic variable reading
-        self.current_read_index = 0      # Current variable being read in sequence
+        self.var_burst_interval = 50  # ms between read bursts of one variable table pass
+        self.edit_entry = None  # In-place editor over a variable value cell
 
         # Bind cleanup on window destroy
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -146,44 +227,30 @@ class CANMonitorWindow:
 
     def get_variable_size(self, var_index):
         """Get the size (in bytes) of a variable"""
+        size = self._var_sizes.get(var_index)
+        if size is not None:
+            return size
+
         if not self.monitor.current_board:
             return 4  # Default
 
-        try:
-            address = self.monitor.current_board.get_variable_address(var_index)
-            if var_index + 1 < len(self.monitor.current_board.table_addr):
-                length = min(4, self.monitor.current_board.table_addr[var_index + 1] - address)
-            else:
-                length = 4  # Default for last variable
-            return length
-        except:
-            return 4  # Default on error
+        return self.monitor.current_board.get_variable_length(var_index)
 
     def format_value_hex(self, value, var_index=None):
         """Format a value as hexadecimal string based on variable size"""
         if isinstance(value, int):
-            # Get variable size if index provided
-            if var_index is not None:
-                size_bytes = self.get_variable_size(var_index)
-            else:
-                size_bytes = 4  # Default
-
-            # Format based on size
+            fmt = self._var_fmt.get(var_index)
+            if fmt is None:
+                if var_index is None:
+                    fmt = _HEX_FORMAT_DEFAULT
+                else:
+                    fmt = _HEX_FORMATS.get(self.get_variable_size(var_index), _HEX_FORMAT_DEFAULT)
+
+            mask, spec = fmt
             if value < 0:
                 # Handle negative values by showing their unsigned hex representation
-                if size_bytes == 1:
-                    return f"0x{value & 0xFF:02X}"
-                elif size_bytes == 2:
-                    return f"0x{value & 0xFFFF:04X}"
-                else:  # 4 bytes or more
-                    return f"0x{value & 0xFFFFFFFF:08X}"
-            else:
-                if size_bytes == 1:
-                    return f"0x{value:02X}"
-                elif size_bytes == 2:
-                    return f"0x{value:04X}"
-                else:  # 4 bytes or more
-                    return f"0x{value:08X}"
+                value &= mask
+            return spec % value
         return str(value)
 
     def create_widgets(self):
@@ -191,6 +258,7 @@ class CANMonitorWindow:
         # Create notebook (tabbed interface)
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill="both", expand=True, padx=5, pady=5)
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
 
         # CAN Bus tab
         self.create_canbus_tab()
@@ -207,25 +275,69 @@ class CANMonitorWindow:
                               relief="sunken", anchor="w")
         status_bar.pack(fill="x", side="bottom")
 
-        # Start status update timer
-        self.status_update_timer()
-
     def update_status_display(self):
         """Update the status bar with current information"""
-        time_since_last_msg = time.time() - self.last_message_time
+        now = time.monotonic()
+        if now < self._status_hold_until:
+            # A transient message is still being shown
+            return
+        time_since_last_msg = now - self.last_message_time
         if time_since_last_msg < 5.0:
             status = f"Connected - Monitoring CAN bus... Messages: {self.message_count}"
         elif time_since_last_msg < 30.0:
             status = f"Connected - Monitoring CAN bus... Messages: {self.message_count} (Last: {time_since_last_msg:.1f}s ago)"
         else:
             status = f"Connected - Monitoring CAN bus... Messages: {self.message_count} (No messages for {time_since_last_msg:.0f}s)"
+        if self.rx_dropped:
+            status += f" - Dropped: {self.rx_dropped}"
         self.status_var.set(status)
 
-    def status_update_timer(self):
-        """Update status display periodically"""
-        if self.monitoring_active:
+    def show_status(self, message):
+        """Show a transient status message, holding off counter repaints for status_hold"""
+        self.status_var.set(message)
+        self._status_hold_until = time.monotonic() + self.status_hold
+
+    def _throttled_status_update(self, now):
+        """Update the status display for new messages, at most 4 times a second"""
+        if now - self._last_status_paint >= 0.25:
+            self._last_status_paint = now
             self.update_status_display()
-            self.root.after(1000, self.status_update_timer)  # Update every second
+
+    def _silence_check(self):
+        """Update the status display while the bus is silent"""
+        if self.monitoring_active:
+            # Arriving messages update the status themselves
+            if time.monotonic() - self.last_message_time > 5.0:
+                self.update_status_display()
+            self.root.after(5000, self._silence_check)
+
+    def _refresh_ages(self):
+        """Repaint the Last Update column of rows whose displayed age changed"""
+        if self.monitoring_active:
+            if self._canbus_visible():
+                now = time.monotonic()
+                can_id_map = self.can_id_map
+                tree_set = self.message_tree.set
+                for can_id, item_id in self.tree_items.items():
+                    data = can_id_map[can_id]
+                    age_str = _fmt_age(now - data['last_update'])
+                    if age_str != data['age_str']:
+                        data['age_str'] = age_str
+                        tree_set(item_id, "Time", age_str)
+            self.root.after(self.rx_age_interval, self._refresh_ages)
+
+    def _canbus_visible(self):
+        """Return True if the CAN Bus Monitor tab is the selected tab"""
+        return self.notebook.select() == self._canbus_tab
+
+    def on_tab_changed(self, event):
+        """Catch up rows that changed while the CAN Bus tab was hidden"""
+        if self._stale_ids and self._canbus_visible():
+            now = time.monotonic()
+            for can_id in self._stale_ids:
+                if can_id in self.can_id_map:
+                    self._upsert_row(can_id, now)
+            self._stale_ids.clear()
 
     def on_tree_double_click(self, event):
         """Handle double-click on treeview to edit values"""
@@ -271,12 +383,12 @@ class CANMonitorWindow:
 
     def save_edit(self, event=None):
         """Save the edited value"""
-        if not hasattr(self, 'edit_entry'):
+        if self.edit_entry is None:
             return
 
         try:
             new_value_str = self.edit_entry.get()
-            new_value = int(new_value_str, 16) if new_value_str.startswith('0x') else int(new_value_str)
+            new_value = _parse_int(new_value_str)
 
             # Write the value to the board
             board_index_str = self.board_index_var.get()
@@ -289,8 +401,7 @@ class CANMonitorWindow:
 
             if success:
                 # Update the display
-                self.variable_values[self.editing_var_index]["value"] = self.format_value_hex(new_value, self.editing_var_index)
-                self.update_variable_display()
+                self._set_variable_value(self.editing_var_index, self.format_value_hex(new_value, self.editing_var_index))
                 self.safe_status_update(f"Edited variable {self.editing_var_index}: {new_value}")
             else:
                 messagebox.showerror("Error", f"Failed to write variable {self.editing_var_index}")
@@ -308,15 +419,15 @@ class CANMonitorWindow:
 
     def cancel_edit(self, event=None):
         """Cancel the current edit"""
-        if hasattr(self, 'edit_entry'):
+        if self.edit_entry is not None:
             self.edit_entry.destroy()
-            delattr(self, 'edit_entry')
+            self.edit_entry = None
 
     def safe_status_update(self, message):
         """Safely update status from any thread"""
         try:
-            if hasattr(self, 'root') and self.root:
-                self.root.after(0, lambda: self.status_var.set(message))
+            if self.root:
+                self.root.after(0, lambda: self.show_status(message))
         except Exception:
             # Ignore errors if GUI is not available
             pass
@@ -325,6 +436,7 @@ class CANMonitorWindow:
         """Create the CAN bus monitoring tab"""
         canbus_frame = ttk.Frame(self.notebook)
         self.notebook.add(canbus_frame, text="CAN Bus Monitor")
+        self._canbus_tab = str(canbus_frame)
 
         # Message list
         list_frame = ttk.LabelFrame(canbus_frame, text="CAN Messages")
@@ -395,10 +507,15 @@ class CANMonitorWindow:
         ttk.Label(var_frame, text="Board Index:").grid(row=1, column=0, padx=5, pady=5, sticky="w")
         self.board_index_var = tk.StringVar(value="0")
         board_index_entry = ttk.Entry(var_frame, textvariable=self.board_index_var, width=10)
+
+        # Parsed CAN ID base / board index are cached until either field changes
+        self.can_id_base_var.trace_add('write', self._invalidate_target)
+        self.board_index_var.trace_add('write', self._invalidate_target)
         board_index_entry.grid(row=1, column=1, padx=5, pady=5)
 
         ttk.Label(var_frame, text="Variable Index:").grid(row=2, column=0, padx=5, pady=5, sticky="w")
         self.var_index_var = tk.StringVar(value="0")
+        self._var_index_get = self.var_index_var.get
         var_index_entry = ttk.Entry(var_frame, textvariable=self.var_index_var, width=10)
         var_index_entry.grid(row=2, column=1, padx=5, pady=5)
 
@@ -471,117 +588,183 @@ Converted from original C++ Borland Builder application."""
     def start_monitoring(self):
         """Start CAN message monitoring"""
         self.monitoring_active = True
+        self._rx_stop.clear()
         self.monitor_thread = threading.Thread(target=self.monitor_can_messages, daemon=True)
         self.monitor_thread.start()
+        self._drain_delay = self.rx_drain_interval
+        self.root.after(self._drain_delay, self._drain_rx_queue)
+        self.root.after(5000, self._silence_check)
+        self.root.after(self.rx_age_interval, self._refresh_ages)
 
     def monitor_can_messages(self):
         """Monitor CAN messages in a separate thread"""
-        while self.monitoring_active:
+        # Back off to a longer receive timeout after 20 empty polls (~2 s of
+        # silence); the first message after that switches straight back
+        timeout = 0.1
+        empty_streak = 0
+        while not self._rx_stop.is_set():
             try:
-                result, message, timestamp = self.monitor.can_comm.receive_message(0.1)
-                if result == CANResult.ERR_OK and message:
-                    self.root.after(0, self.add_message_to_list, message, timestamp)
-                elif result != CANResult.ERR_QRCVEMPTY:
+                # Drain whole bursts per call; the bus is read on python-can's
+                # notifier thread, so this loop only wakes once per burst
+                result, batch = self.monitor.can_comm.receive_batch(256, timeout)
+                if result == CANResult.ERR_OK:
+                    # A full queue discards its oldest frames; count them so
+                    # the status bar shows the list is incomplete
+                    rx_queue = self._rx_queue
+                    overflow = len(rx_queue) + len(batch) - rx_queue.maxlen
+                    if overflow > 0:
+                        self.rx_dropped += overflow
+                    rx_queue.extend(batch)
+                    empty_streak = 0
+                    timeout = 0.1
+                elif result == CANResult.ERR_QRCVEMPTY:
+                    empty_streak += 1
+                    if empty_streak > 20:
+                        timeout = 0.5
+                else:
                     # Log any errors except "no message received"
                     # Suppress CAN receive error
                     self.safe_status_update(f"Receive error: {result}")
-                    time.sleep(0.5)
+                    self._rx_stop.wait(0.5)
 
             except Exception as e:
                 # Suppress CAN monitoring error
                 self.safe_status_update(f"CAN Error: {e}")
-                time.sleep(1)
+                self._rx_stop.wait(1)
+
+    def _drain_rx_queue(self):
+        """Process frames queued by the monitor thread in one GUI batch"""
+        touched = set()
+        rx_queue = self._rx_queue
+        track = self._track_message
+        # One clock read stamps the whole batch
+        now = time.monotonic()
+        for _ in range(self.rx_drain_batch):
+            try:
+                message, timestamp = rx_queue.popleft()
+            except IndexError:
+                break
+            touched.add(track(message, timestamp, now))
+
+        received = bool(touched)
+        if received:
+            self._throttled_status_update(now)
+
+        if received and not self._canbus_visible():
+            # Nobody can see the rows; repaint them when the tab is shown
+            self._stale_ids |= touched
+            touched = ()
+
+        # IDs evicted later in the same batch no longer have a row
+        for can_id in touched:
+            if can_id in self.can_id_map:
+                self._upsert_row(can_id, now)
+
+        # Poll at the batch interval while frames arrive, and back off
+        # exponentially while the bus is quiet
+        if received:
+            self._drain_delay = self.rx_drain_interval
+        else:
+            self._drain_delay = min(self._drain_delay * 2, self.rx_drain_idle_max)
+
+        if self.monitoring_active:
+            self.root.after(self._drain_delay, self._drain_rx_queue)
 
-    def add_message_to_list(self, message, timestamp):
-        """Add or update a received message in the unique ID map"""
+    def _track_message(self, message, timestamp, now):
+        """Record a received message in the unique ID map and return its ID"""
         self.message_count += 1
-        self.last_message_time = time.time()
+        self.last_message_time = now
 
         # Update the CAN ID map
         can_id = message.id
-        if can_id not in self.can_id_map:
+        entry = self.can_id_map.get(can_id)
+        if entry is None:
             # New ID - add it
+            type_str, id_str = _fmt_id(message)
             self.can_id_map[can_id] = {
+                'type_str': type_str,
+                'id_str': id_str,
+                'data_src': None,
+                'data_str': '',
                 'message': message,
                 'timestamp': timestamp,
                 'count': 1,
-                'last_update': time.time()
+                'last_update': now,
+                'age_str': ''
             }
             # If we've exceeded the limit, remove the oldest entry
             if len(self.can_id_map) > self.max_unique_ids:
-                oldest_id = min(self.can_id_map.keys(), key=lambda x: self.can_id_map[x]['last_update'])
-                del self.can_id_map[oldest_id]
+                oldest_id, _ = self.can_id_map.popitem(last=False)
+                item_id = self.tree_items.pop(oldest_id, None)
+                if item_id is not None:
+                    self.message_tree.delete(item_id)
+                    del self._sorted_ids[bisect.bisect_left(self._sorted_ids, oldest_id)]
         else:
             # Existing ID - update it
-            self.can_id_map[can_id]['message'] = message
-            self.can_id_map[can_id]['timestamp'] = timestamp
-            self.can_id_map[can_id]['count'] += 1
-            self.can_id_map[can_id]['last_update'] = time.time()
-
-        # Update the display
-        self.update_message_display()
+            entry['message'] = message
+            entry['timestamp'] = timestamp
+            entry['count'] += 1
+            entry['last_update'] = now
+            self.can_id_map.move_to_end(can_id)
+
+        return can_id
+
+    def _format_row(self, message, data, now):
+        """Format the treeview column values for one tracked CAN ID"""
+        # Type and ID strings are cached when the ID is first seen; the data
+        # string is reformatted only when the payload bytes change
+        payload = message.data
+        if payload != data['data_src']:
+            data['data_src'] = payload
+            data['data_str'] = _fmt_data(payload)
+        data_str = data['data_str']
+
+        # Format time (show time since last update); _refresh_ages keeps it
+        # current for rows whose ID stops arriving
+        time_str = data['age_str'] = _fmt_age(now - data['last_update'])
+
+        return (data['type_str'], data['id_str'], len(message.data), data_str,
+                data['count'], time_str)
+
+    def _upsert_row(self, can_id, now):
+        """Insert the row for a new CAN ID or update its existing row in place"""
+        data = self.can_id_map[can_id]
+        values = self._format_row(data['message'], data, now)
+        item_id = self.tree_items.get(can_id)
+        if item_id is None:
+            # Insert new IDs at their sorted position so the view stays ordered
+            pos = bisect.bisect_left(self._sorted_ids, can_id)
+            self._sorted_ids.insert(pos, can_id)
+            self.tree_items[can_id] = self.message_tree.insert("", pos, values=values)
+        else:
+            self.message_tree.item(item_id, values=values)
 
     def update_message_display(self):
-        """Update the treeview with current unique CAN IDs and their latest data"""
+        """Rebuild the treeview from scratch with current unique CAN IDs"""
         # Clear existing items
         for item in self.message_tree.get_children():
             self.message_tree.delete(item)
+        self.tree_items.clear()
+        self._sorted_ids.clear()
+        self._stale_ids.clear()
 
-        # Sort IDs for consistent display
-        sorted_ids = sorted(self.can_id_map.keys())
-
-        # Add items to treeview
-        for can_id in sorted_ids:
-            data = self.can_id_map[can_id]
-            message = data['message']
-            timestamp = data['timestamp']
-            count = data['count']
-
-            # Format message type
-            if message.msgtype == MessageType.MSGTYPE_EXTENDED:
-                msg_type = "EXTENDED"
-            elif message.msgtype == MessageType.MSGTYPE_RTR:
-                msg_type = "RTR"
-            else:
-                msg_type = "STANDARD"
-
-            # Format ID
-            if message.msgtype == MessageType.MSGTYPE_EXTENDED:
-                msg_id = f"{message.id:08X}h"
-            else:
-                msg_id = f"{message.id:03X}h"
-
-            # Format data
-            data_str = " ".join([f"{b:02X}" for b in message.data])
-
-            # Format time (show time since last update)
-            time_since_update = time.time() - data['last_update']
-            if time_since_update < 1.0:
-                time_str = "< 1s"
-            elif time_since_update < 60.0:
-                time_str = f"{time_since_update:.1f}s"
-            else:
-                time_str = f"{time_since_update/60.0:.1f}m"
-
-            # Add to treeview
-            self.message_tree.insert("", "end", values=(
-                msg_type, msg_id, len(message.data), data_str,
-                count, time_str
-            ))
+        now = time.monotonic()
+        for can_id in self.can_id_map:
+            self._upsert_row(can_id, now)
 
     def clear_messages(self):
         """Clear the message list and CAN ID map"""
-        for item in self.message_tree.get_children():
-            self.message_tree.delete(item)
+        self._rx_queue.clear()
         self.message_count = 0
+        self.rx_dropped = 0
         self.can_id_map.clear()
-        self.last_message_time = time.time()
+        self.update_message_display()
+        self.last_message_time = time.monotonic()
 
         # Also clear variable data and stop timer
-        if self.variable_read_timer:
-            self.root.after_cancel(self.variable_read_timer)
-            self.variable_read_timer = None
+        self._cancel_variable_read()
         self.variable_values.clear()
+        self._dirty_vars.clear()
         for item in self.var_tree.get_children():
             self.var_tree.delete(item)
 
@@ -594,43 +777,46 @@ Converted from original C++ Borland Builder application."""
         )
         if filename:
             try:
-                with open(filename, 'w') as f:
-                    f.write("CAN Message Log - Unique IDs\n")
-                    f.write("=" * 50 + "\n\n")
-                    f.write(f"Total messages received: {self.message_count}\n")
-                    f.write(f"Unique IDs tracked: {len(self.can_id_map)}\n\n")
-
-                    # Sort IDs for consistent output
-                    sorted_ids = sorted(self.can_id_map.keys())
-                    for can_id in sorted_ids:
-                        data = self.can_id_map[can_id]
-                        message = data['message']
-                        count = data['count']
-                        last_update = data['last_update']
-
-                        # Format message type
-                        if message.msgtype == MessageType.MSGTYPE_EXTENDED:
-                            msg_type = "EXTENDED"
-                        else:
-                            msg_type = "STANDARD"
-
-                        # Format ID
-                        if message.msgtype == MessageType.MSGTYPE_EXTENDED:
-                            msg_id = f"{message.id:08X}h"
-                        else:
-                            msg_id = f"{message.id:03X}h"
-
-                        # Format data
-                        data_str = " ".join([f"{b:02X}" for b in message.data])
-
-                        # Format timestamp
-                        timestamp_str = time.strftime("%H:%M:%S", time.localtime(last_update))
-
-                        f.write(f"{msg_type} {msg_id} {len(message.data)} {data_str} Count:{count} Last:{timestamp_str}\n")
+                # IDs are kept sorted for consistent output; last_update is
+                # monotonic, so shift it onto the wall clock for the log
+                wall_offset = time.time() - time.monotonic()
+                timestamp_strs = {}  # Whole second -> formatted time
+                lines = [self._format_log_line(self.can_id_map[can_id], timestamp_strs, wall_offset)
+                         for can_id in self._sorted_ids]
+
+                with open(filename, 'w', buffering=1 << 20) as f:
+                    f.write("CAN Message Log - Unique IDs\n"
+                            + "=" * 50 + "\n\n"
+                            + f"Total messages received: {self.message_count}\n"
+                            + f"Unique IDs tracked: {len(self.can_id_map)}\n\n")
+                    f.writelines(lines)
                 messagebox.showinfo("Success", f"Log saved to {filename}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save log: {e}")
 
+    def _format_log_line(self, data, timestamp_strs, wall_offset):
+        """Format one tracked CAN ID as a save_log line"""
+        message = data['message']
+
+        # Format message type and ID
+        if message.msgtype == _MT_EXTENDED:
+            msg_type = "EXTENDED"
+            msg_id = f"{message.id:08X}h"
+        else:
+            msg_type = "STANDARD"
+            msg_id = f"{message.id:03X}h"
+
+        # Format data
+        data_str = _fmt_data(message.data)
+
+        # Format timestamp, once per distinct second
+        second = int(data['last_update'] + wall_offset)
+        timestamp_str = timestamp_strs.get(second)
+        if timestamp_str is None:
+            timestamp_str = timestamp_strs[second] = time.strftime("%H:%M:%S", time.localtime(second))
+
+        return f"{msg_type} {msg_id} {len(message.data)} {data_str} Count:{data['count']} Last:{timestamp_str}\n"
+
     def on_board_changed(self, event):
         """Handle board type change"""
         pass  # Will be handled when Select Board is clicked
@@ -638,42 +824,41 @@ Converted from original C++ Borland Builder application."""
     def select_board(self):
         """Select and initialize board type"""
         board_type = self.board_var.get()
+        # Sizes and formats belong to the previous board
+        self._var_sizes = {}
+        self._var_fmt = {}
         if self.monitor.select_board(board_type):
             # Set CAN ID base to board default
             default_can_id = self.monitor.current_board.get_default_can_id_base()
             self.can_id_base_var.set(f"0x{default_can_id:03X}")
 
             # Stop any existing variable read timer
-            if hasattr(self, 'variable_read_timer') and self.variable_read_timer:
-                try:
-                    self.root.after_cancel(self.variable_read_timer)
-                except:
-                    pass
-                self.variable_read_timer = None
+            self._cancel_variable_read()
 
             # Clear variable list and values
             for item in self.var_tree.get_children():
                 self.var_tree.delete(item)
             self.variable_values.clear()
+            self._dirty_vars.clear()
 
             # Add variables for selected board
             variables = self.monitor.list_variables()
             for idx, name in variables:
-                self.var_tree.insert("", "end", values=(idx, name, "Reading..."))
-                self.variable_values[idx] = {"name": name, "value": "Reading...", "item_id": None}
-
-            # Get item IDs for updating
-            for item in self.var_tree.get_children():
-                values = self.var_tree.item(item, 'values')
-                idx = int(values[0])
-                self.variable_values[idx]["item_id"] = item
+                item_id = self.var_tree.insert("", "end", values=(idx, name, "Reading..."))
+                self.variable_values[idx] = _VarState(name, "Reading...", item_id)
+
+            # Resolve each variable's size and hex format once per board selection
+            self._var_sizes = {idx: self.get_variable_size(idx) for idx, _ in variables}
+            self._var_fmt = {
+                idx: _HEX_FORMATS.get(size, _HEX_FORMAT_DEFAULT)
+                for idx, size in self._var_sizes.items()
+            }
 
             # Start variable reading immediately
             self.start_variable_reading()
 
-            # Update status if status_var is available (might not be during initialization)
-            if hasattr(self, 'status_var'):
-                self.status_var.set(f"Selected board: {board_type}")
+            # status_var is created at the start of __init__, before the widgets
+            self.show_status(f"Selected board: {board_type}")
         else:
             messagebox.showerror("Error", f"Failed to select board: {board_type}")
 
@@ -681,107 +866,145 @@ Converted from original C++ Borland Builder application."""
         """Start automatic variable reading every 5 seconds"""
         self.read_all_variables()
 
+    def _schedule_variable_read(self, delay_ms):
+        """Schedule the next read_all_variables cycle and remember its timer"""
+        self.variable_read_timer = self.root.after(delay_ms, self.read_all_variables)
+
+    def _cancel_variable_read(self):
+        """Cancel the pending read cycle, if any"""
+        # read_all_variables and _read_variable_burst clear the timer as soon
+        # as they run, so a set timer is always still pending and
+        # after_cancel cannot fail
+        if self.variable_read_timer is not None:
+            self.root.after_cancel(self.variable_read_timer)
+            self.variable_read_timer = None
+
     def read_all_variables(self):
-        """Read all variables sequentially using timer-based approach like C++ code"""
+        """Start a pass over the whole variable table, then schedule the next cycle"""
+        self.variable_read_timer = None
         if not self.variable_values:
             return
+        self._read_variable_burst(list(self.variable_values), 0)
 
-        # Start sequential reading using timer (like C++ TimerCANsendTimer)
-        # CAN ID base and board index will be taken from board defaults
-        self.current_read_index = 0
-        self.send_next_read_request()
-
-    def send_next_read_request(self):
-        """Send next read request in sequence (like C++ TimerCANsendTimer)"""
-        if self.current_read_index >= len(self.variable_values):
-            # All requests sent, schedule next full read cycle
-            self.variable_read_timer = self.root.after(5000, self.read_all_variables)
-            return
-
-        idx = list(self.variable_values.keys())[self.current_read_index]
+    def _read_variable_burst(self, indices, start):
+        """Read one pipelined burst of the variable table, then yield to Tk before the next"""
+        self.variable_read_timer = None
 
+        # The burst's requests go out back-to-back and the replies are
+        # matched as they arrive, so it costs one reply wait rather than
+        # one per variable
+        # CAN ID base and board index will be taken from board defaults
+        burst = indices[start:start + self.monitor.READ_BURST]
         try:
-            success, value = self.monitor.read_variable(idx, None, 0)  # Use board default for CAN ID base, keep board index 0
-            if success:
-                self.variable_values[idx]["value"] = self.format_value_hex(value, idx)
-                # Suppress debug message
-            else:
-                # Don't overwrite existing values with "No Response" to prevent shifting
-                # Suppress debug message
-                pass
-        except Exception as e:
-            # Suppress debug message
-            pass
-
-        # Move to next variable
-        self.current_read_index += 1
-
-        # Schedule next request (small delay like C++ timer)
-        self.root.after(50, self.send_next_read_request)
-
-        # Update display after each successful read
-        self.update_variable_display()
+            values = self.monitor.read_variables(burst, None, 0)
+        except Exception:
+            values = {}
+
+        # Variables that did not answer keep their previous value to prevent shifting;
+        # only rows whose value changed are touched
+        for idx, value in values.items():
+            value_str = self.format_value_hex(value, idx)
+            if value_str != self.variable_values[idx].value:
+                self._set_variable_value(idx, value_str)
+
+        # Tk handles events between bursts; a burst nobody answered means
+        # the board is absent, so the rest of the pass is skipped
+        start += len(burst)
+        if values and start < len(indices):
+            self.variable_read_timer = self.root.after(
+                self.var_burst_interval, self._read_variable_burst, indices, start)
+        else:
+            # Schedule next full read cycle
+            self._schedule_variable_read(5000)
 
     def update_variable_display(self):
-        """Update the variable treeview with current values (stable, no shifting)"""
-        # Always maintain stable order by clearing and re-inserting in sorted order
-        # This prevents shifting but ensures consistent positioning
-
-        # Clear existing items
-        for item in self.var_tree.get_children():
-            self.var_tree.delete(item)
+        """Refresh every variable row with its current value (stable, no shifting)"""
+        # Rows are created once in select_board and updated in place, so
+        # their order never changes
+        for var_idx in self.variable_values:
+            self._update_variable_row(var_idx)
+
+    def _update_variable_row(self, var_idx):
+        """Refresh the treeview row of one variable"""
+        var_data = self.variable_values[var_idx]
+        self.var_tree.item(var_data.item_id, values=(
+            var_idx, var_data.name, var_data.value
+        ))
+
+    def _set_variable_value(self, var_idx, value_str):
+        """Store a formatted variable value and schedule a repaint of its row"""
+        self.variable_values[var_idx].value = value_str
+        # Rows changed by one read cycle are repainted together once Tk is idle
+        self._dirty_vars.add(var_idx)
+        if not self._var_flush_pending:
+            self._var_flush_pending = True
+            self.root.after_idle(self._flush_variable_rows)
+
+    def _flush_variable_rows(self):
+        """Repaint the rows of variables changed since the last flush"""
+        self._var_flush_pending = False
+        for var_idx in self._dirty_vars:
+            if var_idx in self.variable_values:
+                self._update_variable_row(var_idx)
+        self._dirty_vars.clear()
+
+    def _selected_var_index(self):
+        """Parse the variable index field; raises ValueError if invalid"""
+        return int(self._var_index_get())
+
+    def _invalidate_target(self, *args):
+        """Drop the parsed CAN ID base / board index after a field changes"""
+        self._target_cache = None
+
+    def _variable_target(self):
+        """
+        Get the (can_id_base, board_index) to use for single reads and writes
+
+        UI values are used if they differ from the board defaults, otherwise
+        the board defaults (can_id_base None). Without a selected board the
+        UI values are required and a parse error raises ValueError.
+        """
+        board = self.monitor.current_board
+        if self._target_cache is not None and self._target_cache[0] is board:
+            return self._target_cache[1]
+
+        can_id_base_str = self.can_id_base_var.get()
+        board_index_str = self.board_index_var.get()
+
+        if board:
+            # Check if UI values are different from board defaults
+            try:
+                ui_can_id = _parse_int(can_id_base_str)
+                ui_board_index = int(board_index_str)
+                target = (ui_can_id if ui_can_id != board.get_default_can_id_base() else None,
+                          ui_board_index)
+            except ValueError:
+                # Use board defaults if UI parsing fails
+                try:
+                    target = (None, int(board_index_str))
+                except ValueError:
+                    target = (None, 0)
+        else:
+            # No board selected, use UI values
+            target = (_parse_int(can_id_base_str), int(board_index_str))
 
-        # Re-insert all items in sorted order (stable positioning)
-        sorted_var_ids = sorted(self.variable_values.keys())
-        for var_idx in sorted_var_ids:
-            var_data = self.variable_values[var_idx]
-            self.var_tree.insert("", "end", values=(
-                var_idx, var_data["name"], var_data["value"]
-            ))
+        self._target_cache = (board, target)
+        return target
 
     def read_single_variable(self):
         """Read a single variable specified by index"""
         try:
-            var_index = int(self.var_index_var.get())
-
-            # Use UI values if they differ from defaults, otherwise use board defaults
-            can_id_base_str = self.can_id_base_var.get()
-            board_index_str = self.board_index_var.get()
+            var_index = self._selected_var_index()
 
-            if self.monitor.current_board:
-                default_can_id = self.monitor.current_board.get_default_can_id_base()
-
-                # Check if UI values are different from board defaults
-                try:
-                    ui_can_id = int(can_id_base_str, 16) if can_id_base_str.startswith('0x') else int(can_id_base_str)
-                    ui_board_index = int(board_index_str)
-
-                    if ui_can_id != default_can_id:
-                        # Use UI values
-                        success, value = self.monitor.read_variable(var_index, ui_can_id, ui_board_index)
-                    else:
-                        # Use board defaults
-                        success, value = self.monitor.read_variable(var_index, None, ui_board_index)
-                except ValueError:
-                    # Use board defaults if UI parsing fails
-                    try:
-                        ui_board_index = int(board_index_str)
-                        success, value = self.monitor.read_variable(var_index, None, ui_board_index)
-                    except ValueError:
-                        success, value = self.monitor.read_variable(var_index, None, 0)
-            else:
-                # No board selected, use UI values
-                can_id_base = int(can_id_base_str, 16) if can_id_base_str.startswith('0x') else int(can_id_base_str)
-                board_index = int(board_index_str)
-                success, value = self.monitor.read_variable(var_index, can_id_base, board_index)
+            can_id_base, board_index = self._variable_target()
+            success, value = self.monitor.read_variable(var_index, can_id_base, board_index)
 
             if success:
                 self.var_value_var.set(self.format_value_hex(value, var_index))
                 self.safe_status_update(f"Read variable {var_index}: {value}")
                 # Also update in the table if it exists
                 if var_index in self.variable_values:
-                    self.variable_values[var_index]["value"] = self.format_value_hex(value, var_index)
-                    self.update_variable_display()
+                    self._set_variable_value(var_index, self.format_value_hex(value, var_index))
             else:
                 self.var_value_var.set("No Response")
                 self.safe_status_update(f"No response for variable {var_index}")
@@ -794,23 +1017,23 @@ Converted from original C++ Borland Builder application."""
     def on_closing(self):
         """Clean up when window is closing"""
         self.monitoring_active = False
-        if self.variable_read_timer:
-            try:
-                self.root.after_cancel(self.variable_read_timer)
-            except:
-                pass  # Timer might already be cancelled
-            self.variable_read_timer = None
+        self._rx_stop.set()
+        if self.monitor_thread:
+            # At most one receive timeout away from noticing the stop
+            self.monitor_thread.join(timeout=1.0)
+            self.monitor_thread = None
+        self._cancel_variable_read()
         self.root.destroy()
 
     def read_variable(self):
         """Read a variable from the board"""
         try:
-            var_index = int(self.var_index_var.get())
+            var_index = self._selected_var_index()
             success, value = self.monitor.read_variable(var_index)
 
             if success:
                 self.var_value_var.set(self.format_value_hex(value, var_index))
-                self.status_var.set(f"Read variable {var_index}: {value}")
+                self.show_status(f"Read variable {var_index}: {value}")
             else:
                 messagebox.showerror("Error", f"Failed to read variable {var_index}")
         except ValueError:
@@ -821,48 +1044,19 @@ Converted from original C++ Borland Builder application."""
     def write_variable(self):
         """Write a variable to the board"""
         try:
-            var_index = int(self.var_index_var.get())
+            var_index = self._selected_var_index()
             value_str = self.var_value_var.get()
-            value = int(value_str, 16) if value_str.startswith('0x') else int(value_str)
-
-            # Use UI values if they differ from defaults, otherwise use board defaults
-            can_id_base_str = self.can_id_base_var.get()
-            board_index_str = self.board_index_var.get()
-
-            if self.monitor.current_board:
-                default_can_id = self.monitor.current_board.get_default_can_id_base()
+            value = _parse_int(value_str)
 
-                # Check if UI values are different from board defaults
-                try:
-                    ui_can_id = int(can_id_base_str, 16) if can_id_base_str.startswith('0x') else int(can_id_base_str)
-                    ui_board_index = int(board_index_str)
-
-                    if ui_can_id != default_can_id:
-                        # Use UI values
-                        success = self.monitor.write_variable(var_index, value, ui_can_id, ui_board_index)
-                    else:
-                        # Use board defaults
-                        success = self.monitor.write_variable(var_index, value, None, ui_board_index)
-                except ValueError:
-                    # Use board defaults if UI parsing fails
-                    try:
-                        ui_board_index = int(board_index_str)
-                        success = self.monitor.write_variable(var_index, value, None, ui_board_index)
-                    except ValueError:
-                        success = self.monitor.write_variable(var_index, value, None, 0)
-            else:
-                # No board selected, use UI values
-                can_id_base = int(can_id_base_str, 16) if can_id_base_str.startswith('0x') else int(can_id_base_str)
-                board_index = int(board_index_str)
-                success = self.monitor.write_variable(var_index, value, can_id_base, board_index)
+            can_id_base, board_index = self._variable_target()
+            success = self.monitor.write_variable(var_index, value, can_id_base, board_index)
 
             if success:
                 self.safe_status_update(f"Wrote variable {var_index}: {value}")
                 messagebox.showinfo("Success", f"Variable {var_index} written successfully")
                 # Update the table if this variable is displayed
                 if var_index in self.variable_values:
-                    self.variable_values[var_index]["value"] = self.format_value_hex(value, var_index)
-                    self.update_variable_display()
+                    self._set_variable_value(var_index, self.format_value_hex(value, var_index))
             else:
                 messagebox.showerror("Error", f"Failed to write variable {var_index}")
         except ValueError:
@@ -887,7 +1081,7 @@ class CANMonitorApp:
         settings_root.mainloop()
 
         # If connection successful, show main window
-        if hasattr(self, 'monitor') and self.monitor:
+        if self.monitor is not None:
             # Create main monitoring window after settings window closes
             self.root = tk.Tk()
             self.monitor_window = CANMonitorWindow(self.root, self.monitor)